@@ -1,13 +1,16 @@
+import asyncio
 import json
 import logging
 import os
 import re
+import weakref
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from langchain_openai import ChatOpenAI
 from mcp_use import MCPAgent, MCPClient
-from scalapay.scalapay_mcp_kam.prompts.charts_prompt import SLIDE_CONTENT_OPTIMIZATION_PROMPT, SLIDES_GENERATION_PROMPT
+from scalapay.scalapay_mcp_kam.prompts.cache import get_prompt_cache
+from scalapay.scalapay_mcp_kam.prompts.charts_prompt import format_prompt, render_prompt
 from scalapay.scalapay_mcp_kam.tools.chart_utils import _extract_months_map, _normalize_months_map
 
 
@@ -42,7 +45,8 @@ def _slug(s: str) -> str:
 
 # 1) Pure prompt formatter
 def format_chart_prompt(tpl: str, *, data_type: str, merchant_token: str, starting_date: str, end_date: str) -> str:
-    return tpl.format(
+    return format_prompt(
+        tpl,
         data_type=data_type,
         merchant_token=merchant_token,
         starting_date=starting_date,
@@ -52,7 +56,17 @@ def format_chart_prompt(tpl: str, *, data_type: str, merchant_token: str, starti
 
 # 2) Alfred runner for one request
 async def run_alfred_for_request(agent, chart_prompt: str) -> Any:
-    return await agent.run(chart_prompt, max_steps=15)
+    cache = get_prompt_cache()
+    if cache is None:
+        return await agent.run(chart_prompt, max_steps=15)
+    return await cache.get_or_run(
+        chart_prompt, lambda prompt: agent.run(prompt, max_steps=15), is_cacheable=_has_data_object
+    )
+
+
+def _has_data_object(alfred_result: Any) -> bool:
+    """Only cache Alfred answers that carry a parseable data object; errors and empty replies are retried"""
+    return bool(_extract_months_map(alfred_result))
 
 
 # 3) Persist raw artifact (optional)
@@ -68,7 +82,19 @@ def persist_raw_result(data_type: str, alfred_result: Any, outdir: str = "./tmp"
 
 # 4) Slides struct builder (separate LLM)
 async def build_slides_struct(llm_struct, alfred_result: Any) -> dict | None:
-    resp = await llm_struct.ainvoke(SLIDES_GENERATION_PROMPT.format(alfred_result=alfred_result))
+    prompt = render_prompt("SLIDES_GENERATION_PROMPT", alfred_result=alfred_result)
+    cache = get_prompt_cache()
+    if cache is None:
+        return await _invoke_slides_struct(llm_struct, prompt)
+    return await cache.get_or_run(
+        prompt,
+        lambda p: _invoke_slides_struct(llm_struct, p),
+        is_cacheable=lambda struct: isinstance(struct, dict) and bool(struct),
+    )
+
+
+async def _invoke_slides_struct(llm_struct, prompt: str) -> dict | None:
+    resp = await llm_struct.ainvoke(prompt)
     if hasattr(resp, "dict"):
         return resp.dict()
     if isinstance(resp, dict):
@@ -95,6 +121,27 @@ def derive_normalized_months(slides_struct: dict | None, alfred_result: Any) ->
     return months_map, normalized
 
 
+# Max Alfred agent runs in flight per mcp_tool_run call
+MAX_ALFRED_CONCURRENCY = 4
+
+ALFRED_MCP_CONFIG = {"mcpServers": {"http": {"url": "http://127.0.0.1:8000/mcp"}}}
+
+# Default Alfred client + LLM, reused by every mcp_tool_run on the same event loop so MCP sessions and
+# HTTP connection pools survive between calls (their async transports are bound to the loop they were made on)
+_alfred_defaults: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[MCPClient, ChatOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _default_alfred_client_and_llm() -> Tuple[MCPClient, ChatOpenAI]:
+    loop = asyncio.get_running_loop()
+    defaults = _alfred_defaults.get(loop)
+    if defaults is None:
+        defaults = (MCPClient.from_dict(ALFRED_MCP_CONFIG), ChatOpenAI(model="gpt-4o"))
+        _alfred_defaults[loop] = defaults
+    return defaults
+
+
 # 6) Orchestrator (now very thin)
 async def mcp_tool_run(
     requests_list: List[str],
@@ -107,17 +154,20 @@ async def mcp_tool_run(
     client: MCPClient | None = None,
     llm: ChatOpenAI | None = None,
     ctx = None,  # Add context parameter
+    max_concurrency: int = MAX_ALFRED_CONCURRENCY,
 ) -> Dict[str, Any]:
     if ctx:
         await ctx.info(f"🔍 Starting data retrieval for {merchant_token}")
         await ctx.info(f"📋 Processing {len(requests_list)} data requests: {', '.join(requests_list)}")
     
     if agent is None:
-        client = client or MCPClient.from_dict({"mcpServers": {"http": {"url": "http://127.0.0.1:8000/mcp"}}})
+        if client is None or llm is None:
+            default_client, default_llm = _default_alfred_client_and_llm()
+            client = client or default_client
+            llm = llm or default_llm
         if ctx:
             await ctx.info("🔌 Connected to Alfred MCP server (localhost:8000)")
-            
-        llm = llm or ChatOpenAI(model="gpt-4o")
+
         agent = MCPAgent(llm=llm, client=client, max_steps=15, verbose=False)
         if ctx:
             await ctx.info("🤖 Initialized GPT-4 agent with 15-step limit")
@@ -127,6 +177,8 @@ async def mcp_tool_run(
     llm_struct = (llm or agent.llm).with_structured_output(SlidesContent)
 
     results: Dict[str, Any] = {}
+    # Requests run concurrently, but only a few hit the Alfred MCP server at once
+    alfred_slots = asyncio.Semaphore(max_concurrency)
 
     # Concurrent processing of all requests
     async def process_single_request(data_type: str, index: int) -> tuple[str, dict]:
@@ -206,9 +258,10 @@ async def mcp_tool_run(
         try:
             if ctx:
                 await ctx.info(f"  🔍 Querying Alfred for {data_type}...")
-            alfred_result = await run_alfred_for_request(agent, prompt)
+            async with alfred_slots:
+                alfred_result = await run_alfred_for_request(agent, prompt)
             entry["alfred_raw"] = alfred_result
-            persist_raw_result(data_type, alfred_result)
+            await asyncio.to_thread(persist_raw_result, data_type, alfred_result)
             if ctx:
                 await ctx.info(f"  ✅ Raw data received for {data_type}")
         except Exception as e:
@@ -233,7 +286,6 @@ async def mcp_tool_run(
         return data_type, entry
 
     # Execute all requests concurrently
-    import asyncio
     tasks = [process_single_request(data_type, i) for i, data_type in enumerate(requests_list, 1)]
     completed_results = await asyncio.gather(*tasks, return_exceptions=True)
     
@@ -284,8 +336,37 @@ def _format_structured_data_summary(structured_data: dict) -> str:
     return summary.strip()
 
 
+# Paragraph input cap for slide optimization; leading sentences (the topic) are kept
+MAX_OPTIMIZATION_PARAGRAPH_CHARS = 1200
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def _window_paragraph(paragraph: str, max_chars: int = MAX_OPTIMIZATION_PARAGRAPH_CHARS) -> str:
+    """Keep the leading sentences of a paragraph that fit within max_chars."""
+    if not isinstance(paragraph, str) or len(paragraph) <= max_chars:
+        return paragraph
+
+    kept: List[str] = []
+    size = 0
+    for sentence in _SENTENCE_END_RE.split(paragraph.strip()):
+        size += len(sentence) + (1 if kept else 0)
+        if size > max_chars:
+            break
+        kept.append(sentence)
+
+    if not kept:
+        # A single oversized first sentence: cut at the last word boundary within the limit
+        return paragraph[:max_chars].rsplit(" ", 1)[0]
+    return " ".join(kept)
+
+
 async def process_slide_paragraph(
-    title: str, full_paragraph: str, structured_data: dict, slide_context: dict, llm_processor: ChatOpenAI
+    title: str,
+    full_paragraph: str,
+    structured_data: dict,
+    slide_context: dict,
+    llm_processor: ChatOpenAI,
+    max_paragraph_chars: int = MAX_OPTIMIZATION_PARAGRAPH_CHARS,
 ) -> OptimizedSlidesContent:
     """
     Process raw paragraph content into slide-optimized format.
@@ -296,6 +377,7 @@ async def process_slide_paragraph(
         structured_data: Chart data for context
         slide_context: Presentation metadata (position, total slides, etc.)
         llm_processor: Configured LLM instance
+        max_paragraph_chars: Cap on the paragraph sent to the LLM (leading sentences are kept)
 
     Returns:
         OptimizedSlidesContent with both slide and notes content
@@ -304,12 +386,13 @@ async def process_slide_paragraph(
         chart_type = slide_context.get("chart_type", _infer_chart_type(title, structured_data))
         structured_data_summary = _format_structured_data_summary(structured_data)
 
-        prompt = SLIDE_CONTENT_OPTIMIZATION_PROMPT.format(
+        prompt = render_prompt(
+            "SLIDE_CONTENT_OPTIMIZATION_PROMPT",
             title=title,
             chart_type=chart_type,
             slide_index=slide_context.get("slide_index", 1),
             total_slides=slide_context.get("total_slides", 1),
-            full_paragraph=full_paragraph,
+            full_paragraph=_window_paragraph(full_paragraph, max_paragraph_chars),
             structured_data_summary=structured_data_summary,
         )
 
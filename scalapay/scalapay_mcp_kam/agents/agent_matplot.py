@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
 import re
 import uuid
-from typing import Any, Dict, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
 
 from langchain_openai import ChatOpenAI
 from mcp_use import MCPAgent, MCPClient
-from scalapay.scalapay_mcp_kam.prompts.charts_prompt import MONTHLY_SALES_PROMPT, STRUCTURED_CHART_SCHEMA_PROMPT
+from scalapay.scalapay_mcp_kam.prompts.charts_prompt import MONTHLY_SALES_PROMPT, render_prompt
+
+logger = logging.getLogger(__name__)
 
 # ---------- utils ----------
 
@@ -56,6 +60,47 @@ def _extract_struct_and_paragraph(entry: Dict[str, Any]) -> Tuple[dict | None, s
     return structured, paragraph, total_variations
 
 
+# Known data types (lowercased) -> chart type, resolved without any heuristics
+CHART_RULES: Mapping[str, str] = MappingProxyType(
+    {
+        "monthly sales over time": "bar",
+        "monthly sales year over year": "bar",
+        "monthly sales by product type": "stacked_bar",
+        "monthly sales by product type over time": "stacked_bar",
+        "monthly orders by user type": "stacked_bar",
+        "orders by product type (i.e. pay in 3, pay in 4)": "stacked_bar",
+        "aov": "line",
+        "aov over time": "line",
+        "average order value over time": "line",
+        "aov by product type (i.e. pay in 3, pay in 4)": "line",
+        "scalapay users demographic": "pie",
+        "scalapay users demographic in percentages": "pie",
+        "age distribution": "pie",
+        "gender distribution": "pie",
+        "card type distribution": "pie",
+    }
+)
+
+
+# Keyword fallback for data types outside CHART_RULES, compiled once; earlier chart types win on ties
+_CHART_TYPE_ROUTER = re.compile(
+    r"(?P<line>AOV|Average Order Value)"
+    r"|(?P<stacked_bar>(?i:user type|product type))"
+    r"|(?P<pie>(?i:demographic|percentage|\b(?:age|gender|card type)\s+distribution\b))"
+)
+_CHART_TYPE_PRIORITY = ("line", "stacked_bar", "pie")
+
+
+def _select_chart_type(data_type: str) -> str:
+    """Pick the chart type from the rule table, falling back to keyword matching for unknown data types."""
+    chart_type = CHART_RULES.get(data_type.lower())
+    if chart_type:
+        return chart_type
+
+    matched = {m.lastgroup for m in _CHART_TYPE_ROUTER.finditer(data_type)}
+    return next((ct for ct in _CHART_TYPE_PRIORITY if ct in matched), "bar")
+
+
 def _persist_plot_ref(data_type: str, path: str | None, out_dir: str = "./plots") -> str | None:
     """Copy the generated PNG into ./plots with a stable-ish name."""
     if not isinstance(path, str) or not path.lower().endswith(".png"):
@@ -185,29 +230,29 @@ async def mcp_matplot_run(
         return False
     
     valid_entries = [k for k, v in results_dict.items() if has_valid_structured_data(v)]
-    print(f"[DEBUG] Valid entries for chart generation: {valid_entries}")
+    logger.debug("Valid entries for chart generation: %s", valid_entries)
     
     # Debug: Show what structured_data looks like for each valid entry
-    for k in valid_entries:
-        v = results_dict[k]
-        sd = v.get("structured_data")
-        print(f"[DEBUG] {k} structured_data: {type(sd)} - {sd}")
-        if isinstance(sd, dict):
-            print(f"[DEBUG] {k} structured_data length: {len(sd)}")
-            if sd:
-                print(f"[DEBUG] {k} first few items: {dict(list(sd.items())[:3])}")
-        
+    if logger.isEnabledFor(logging.DEBUG):
+        for k in valid_entries:
+            sd = results_dict[k].get("structured_data")
+            logger.debug("%s structured_data: %s - %s", k, type(sd), sd)
+            if isinstance(sd, dict):
+                logger.debug("%s structured_data length: %d", k, len(sd))
+                if sd:
+                    logger.debug("%s first few items: %s", k, dict(list(sd.items())[:3]))
+
     if not valid_entries:
         if ctx:
             await ctx.warning("⚠️ No valid entries found for chart generation")
-        print("[DEBUG] No valid entries found - returning original results")
+        logger.debug("No valid entries found - returning original results")
         return results_dict
     
     async def process_single_chart(data_type: str, entry: dict, index: int) -> tuple[str, dict]:
         """Process a single chart generation concurrently."""
-        print(f"[DEBUG] Starting process_single_chart for: {data_type}")
+        logger.debug("Starting process_single_chart for: %s", data_type)
         if not isinstance(entry, dict):
-            print(f"[DEBUG] Invalid entry type for {data_type}: {type(entry).__name__}")
+            logger.debug("Invalid entry type for %s: %s", data_type, type(entry).__name__)
             return data_type, {"errors": [f"Invalid entry type: {type(entry).__name__}"], "chart_path": None}
 
         entry.setdefault("errors", [])
@@ -219,18 +264,18 @@ async def mcp_matplot_run(
         try:
             # 1) extract chartable info
             structured_data, paragraph, total_variations = _extract_struct_and_paragraph(entry)
-            print(f"[DEBUG] {data_type} - structured_data: {structured_data}")
-            print(f"[DEBUG] {data_type} - paragraph: {paragraph}")
+            logger.debug("%s - structured_data: %s", data_type, structured_data)
+            logger.debug("%s - paragraph: %s", data_type, paragraph)
             
             if not isinstance(structured_data, dict):
-                print(f"[DEBUG] {data_type} - No valid structured data, skipping")
+                logger.debug("%s - No valid structured data, skipping", data_type)
                 if ctx:
                     await ctx.warning(f"  ⚠️ No valid structured data for {data_type}")
                 entry["errors"].append("No structured_data available or invalid.")
                 return data_type, entry
                 
             if not structured_data:  # Empty dict
-                print(f"[DEBUG] {data_type} - Empty structured data, skipping")
+                logger.debug("%s - Empty structured data, skipping", data_type)
                 if ctx:
                     await ctx.warning(f"  ⚠️ Empty structured data for {data_type}")
                 entry["errors"].append("Structured data is empty.")
@@ -238,16 +283,8 @@ async def mcp_matplot_run(
                 
             if ctx:
                 await ctx.info(f"  📋 Data points: {len(structured_data)} entries")
-                await ctx.info(f"  🤖 AI selecting optimal chart type...")
-            chart_type = "bar"  # Default
-            if "AOV" in data_type or "Average Order Value" in data_type:
-                chart_type = "line"
-            elif "user type" in data_type.lower() or "product type" in data_type.lower():
-                chart_type = "stacked_bar"
-            elif "demographic" in data_type.lower() or "percentage" in data_type.lower():
-                chart_type = "pie"
-            elif "user type" in data_type.lower():
-                chart_type = "stacked_bar"
+                await ctx.info(f"  📐 Selecting chart type...")
+            chart_type = _select_chart_type(data_type)
 
             # Chart-specific labeling instructions
             labeling_instructions = {
@@ -274,8 +311,8 @@ async def mcp_matplot_run(
 
             # 2) build a concise instruction (no code; the tool handles codegen)
             # Keep it deterministic: require chart_output.png at 300 DPI.
-            instruction = STRUCTURED_CHART_SCHEMA_PROMPT.format(
-                alfred_data_description=paragraph, data=structured_data
+            instruction = render_prompt(
+                "STRUCTURED_CHART_SCHEMA_PROMPT", alfred_data_description=paragraph, data=structured_data
             ) + (
                 "Create a clean, publication-quality Matplotlib chart from the data below.\n"
                 "Do NOT call plt.show(). Save the figure exactly as 'chart_output.png' at 300 DPI.\n"
@@ -291,7 +328,7 @@ async def mcp_matplot_run(
                 f"Notes: {paragraph or ''}"
                 f"{' Total variations: ' + json.dumps(total_variations) if total_variations else ''}"
             )
-            print(f"\n[DEBUG] MatPlot instruction for '{data_type}':\n{instruction}\n")
+            logger.debug("MatPlot instruction for '%s':\n%s", data_type, instruction)
             entry["matplot_instruction"] = instruction
 
             # 3) call the tool directly (no planner in the middle)
@@ -307,7 +344,7 @@ async def mcp_matplot_run(
             try:
                 try:
                     tool_result = await tool.ainvoke(args)  # some wrappers expect a single dict
-                    print("TOOL RESULT:", tool_result)
+                    logger.debug("Tool result: %s", tool_result)
                 except TypeError:
                     tool_result = await tool.ainvoke(**args)  # others expect kwargs
                     
@@ -326,47 +363,47 @@ async def mcp_matplot_run(
             # 4) recover/ensure chart_path
             returned_path = tool_result.get("chart_path")
 
-            print(f"[DEBUG] Initial chart_path from tool: {returned_path}")
-            print(f"[DEBUG] Tool result keys: {list(tool_result.keys())}")
+            logger.debug("Initial chart_path from tool: %s", returned_path)
+            logger.debug("Tool result keys: %s", list(tool_result.keys()))
 
             # 4a) If missing, scan workspace for any PNG (filename drift)
             if not returned_path:
                 ws = tool_result.get("workspace_path")
-                print(f"[DEBUG] Workspace path: {ws}")
+                logger.debug("Workspace path: %s", ws)
 
                 if isinstance(ws, str) and os.path.isdir(ws):
                     try:
                         all_files = os.listdir(ws)
                         pngs = [os.path.join(ws, f) for f in all_files if f.lower().endswith(".png")]
-                        print(f"[DEBUG] All files in workspace: {all_files}")
-                        print(f"[DEBUG] PNG files found: {[os.path.basename(p) for p in pngs]}")
+                        logger.debug("All files in workspace: %s", all_files)
+                        logger.debug("PNG files found: %s", [os.path.basename(p) for p in pngs])
 
                         if pngs:
                             latest_png = max(pngs, key=os.path.getmtime)
                             returned_path = latest_png
                             tool_result["chart_path"] = returned_path
-                            print(f"[DEBUG] Using latest PNG: {os.path.basename(latest_png)}")
+                            logger.debug("Using latest PNG: %s", os.path.basename(latest_png))
                     except Exception as e:
-                        print(f"[DEBUG] Workspace scan failed: {e}")
+                        logger.debug("Workspace scan failed: %s", e)
                         entry["errors"].append(f"Workspace scan failed: {e}")
                 else:
-                    print(f"[DEBUG] No valid workspace directory found")
+                    logger.debug("No valid workspace directory found")
 
             # 4b) As a last resort, extract a sandbox link from any raw text (debug-only)
             if not returned_path:
                 raw = ""
                 if isinstance(tool_result.get("raw"), str):
                     raw = tool_result["raw"]
-                print(f"[DEBUG] Raw text available: {bool(raw)}")
+                logger.debug("Raw text available: %s", bool(raw))
                 if raw:
                     m = re.search(r"(sandbox:/[^\s\)]*\.png)", raw)
                     if m:
                         returned_path = m.group(1)  # not a local file; record only for traceability
                         tool_result["chart_path"] = returned_path
                         entry["errors"].append("Chart path points to a sandbox link (not a local file on this system).")
-                        print(f"[DEBUG] Found sandbox link: {returned_path}")
+                        logger.debug("Found sandbox link: %s", returned_path)
 
-            print(f"[DEBUG] Final returned_path: {returned_path}")
+            logger.debug("Final returned_path: %s", returned_path)
 
             # 5) persist/copy PNG into ./plots and set entry['chart_path']
             try:
@@ -406,7 +443,7 @@ async def mcp_matplot_run(
         for result in completed_results:
             if isinstance(result, Exception):
                 # Log the exception but continue processing other results
-                print(f"[ERROR] Chart generation task failed: {result}")
+                logger.error("Chart generation task failed: %s", result)
                 if ctx:
                     await ctx.error(f"❌ Chart generation task failed: {str(result)}")
                 continue
@@ -42,6 +42,15 @@ class Config:
         )
         self.default_template_id = "1hDkICKx4D3jHdxky_3_1iJcPFVQFxTkvlH7mVSFCx_o"
         self.default_folder_id = "1x03ugPUeGSsLYY2kH-FsNC9_f_M6iLGL"
+        # Retries (exponential backoff with jitter) for Google API requests failing with 429/5xx
+        self.google_api_num_retries = int(os.getenv("GOOGLE_API_NUM_RETRIES", "4"))
+
+        # Exact-match cache of agent responses for identical rendered prompts
+        self.prompt_cache_enabled = os.getenv("ENABLE_PROMPT_CACHE", "false").lower() == "true"
+        self.prompt_cache_dir = os.getenv("PROMPT_CACHE_DIR") or None
+        ttl = os.getenv("PROMPT_CACHE_TTL_SECONDS")
+        self.prompt_cache_ttl_seconds = float(ttl) if ttl else None
+        self.prompt_cache_max_entries = int(os.getenv("PROMPT_CACHE_MAX_ENTRIES", "256"))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary for logging/debugging."""
@@ -59,6 +68,11 @@ class Config:
             "google_credentials_path": self.google_credentials_path,
             "default_template_id": self.default_template_id,
             "default_folder_id": self.default_folder_id,
+            "google_api_num_retries": self.google_api_num_retries,
+            "prompt_cache_enabled": self.prompt_cache_enabled,
+            "prompt_cache_dir": self.prompt_cache_dir,
+            "prompt_cache_ttl_seconds": self.prompt_cache_ttl_seconds,
+            "prompt_cache_max_entries": self.prompt_cache_max_entries,
         }
 
 
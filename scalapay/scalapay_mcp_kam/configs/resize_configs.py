@@ -1,8 +1,16 @@
+"""
+Chart placeholder resize specs for template fills.
+
+Slides transform scales are unitless, so scaleX/scaleY here are multipliers of the placeholder's
+template size (1.0 keeps it); translateX/translateY are the placeholder's new position in ``unit``.
+The specs are merged into each placeholder's current transform before the chart replaces it.
+"""
+
 RESIZE_DEFAULT = {
     "mode": "ABSOLUTE",
     "unit": "PT",
-    "scaleX": 200,
-    "scaleY": 200,
+    "scaleX": 1.0,
+    "scaleY": 1.0,
     "translateX": 130,
     "translateY": 250,
 }
@@ -11,57 +19,57 @@ PER_CHART_RESIZE = {
     "{{monthly-sales-over-time_chart}}": {
         "mode": "ABSOLUTE",
         "unit": "PT",
-        "scaleX": 180,
-        "scaleY": 180,
+        "scaleX": 0.9,
+        "scaleY": 0.9,
         "translateX": 190,
         "translateY": 190,
     },
     "{{monthly_sales_yoy_chart}}": {
         "mode": "ABSOLUTE",
         "unit": "PT",
-        "scaleX": 190,
-        "scaleY": 190,
+        "scaleX": 0.95,
+        "scaleY": 0.95,
         "translateX": 110,
         "translateY": 250,
     },
     "{{aov_chart}}": {
         "mode": "ABSOLUTE",
         "unit": "PT",
-        "scaleX": 180,
-        "scaleY": 180,
+        "scaleX": 0.9,
+        "scaleY": 0.9,
         "translateX": 140,
         "translateY": 240,
     },
     "{{scalapay-users-demographic-in-percentage_chart}}": {
         "mode": "ABSOLUTE",
         "unit": "PT",
-        "scaleX": 220,
-        "scaleY": 220,
+        "scaleX": 1.1,
+        "scaleY": 1.1,
         "translateX": 90,
         "translateY": 240,
     },
     "{{monthly-orders-by-user-type_chart}}": {
         "mode": "ABSOLUTE",
         "unit": "PT",
-        "scaleX": 185,
-        "scaleY": 185,
+        "scaleX": 0.925,
+        "scaleY": 0.925,
         "translateX": 115,
         "translateY": 255,
     },
     "{{orders-by-product-type-i-e-pay-in-3-pay_chart}}": {
         "mode": "ABSOLUTE",
         "unit": "PT",
-        "scaleX": 170,
-        "scaleY": 170,
+        "scaleX": 0.85,
+        "scaleY": 0.85,
         "translateX": 120,
         "translateY": 240,
     },
     "{{aov-by-product-type-i-e-pay-in-3-pay-in_chart}}": {
         "mode": "ABSOLUTE",
         "unit": "PT",
-        "scaleX": 150,
-        "scaleY": 150,
+        "scaleX": 0.75,
+        "scaleY": 0.75,
         "translateX": 135,
         "translateY": 225,
     },
-}
\ No newline at end of file
+}
@@ -8,7 +8,8 @@ import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Union
 
 
 class ChartType(Enum):
@@ -142,7 +143,7 @@ class DataRequirement:
 
 
 # Comprehensive Alfred Data Requirements Registry
-ALFRED_DATA_REQUIREMENTS: Dict[str, DataRequirement] = {
+_ALFRED_DATA_REQUIREMENTS: Dict[str, DataRequirement] = {
     "monthly sales over time": DataRequirement(
         data_type="monthly sales over time",
         chart_type=ChartType.BAR_CHART,
@@ -451,6 +452,9 @@ ALFRED_DATA_REQUIREMENTS: Dict[str, DataRequirement] = {
     ),
 }
 
+# Exported read-only view; prompt caches built from the registry rely on it not changing
+ALFRED_DATA_REQUIREMENTS: Mapping[str, DataRequirement] = MappingProxyType(_ALFRED_DATA_REQUIREMENTS)
+
 
 class AlfredSchemaValidator:
     """Validator for Alfred responses using schema registry"""
@@ -1,4 +1,5 @@
 import base64
+import json
 import os
 import sys
 import time
@@ -8,7 +9,7 @@ from dotenv import load_dotenv
 from fastmcp import Context, FastMCP
 from langchain_core.runnables import RunnableConfig
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
 import logging
 
@@ -26,17 +27,21 @@ mcp = FastMCP(
 config = RunnableConfig()
 
 
+# Static part of the health payload, encoded once; only the timestamp is added per probe
+_HEALTH_PREFIX = json.dumps(
+    {
+        "status": "healthy",
+        "service": "company-intelligence",
+        "version": "1.0.0",
+        "services": {"slides_creation": "available", "pdf_reading": "available", "google_drive": "available"},
+    },
+    separators=(",", ":"),
+)[:-1].encode()
+
+
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request: Request):
-    return JSONResponse(
-        {
-            "status": "healthy",
-            "service": "company-intelligence",
-            "version": "1.0.0",
-            "timestamp": time.time(),
-            "services": {"slides_creation": "available", "pdf_reading": "available", "google_drive": "available"},
-        }
-    )
+    return Response(_HEALTH_PREFIX + f',"timestamp":{time.time()}}}'.encode(), media_type="application/json")
 
 @mcp.custom_route("/", methods=["GET", "POST"])
 async def root_ok(_: Request):
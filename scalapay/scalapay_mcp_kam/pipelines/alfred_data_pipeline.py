@@ -13,7 +13,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from ..agents.agent_alfred_rigid import RigidAlfredAgent, mcp_tool_run_rigid
 from ..agents.agent_matplot_rigid_integrated import mcp_matplot_run_rigid_integrated
 from ..data_schemas.alfred_schema_registry import DataRequirement, alfred_validator
-from ..prompts.alfred_rigid_prompts import alfred_prompt_builder
+from ..prompts.alfred_rigid_prompts import get_alfred_prompt_builder
 from ..utils.concurrency_utils import ConcurrencyManager, create_correlation_id
 
 logger = logging.getLogger(__name__)
@@ -99,7 +99,7 @@ class AlfredDataPipeline:
     def __init__(self, config: PipelineConfig = None):
         self.config = config or PipelineConfig()
         self.validator = alfred_validator
-        self.prompt_builder = alfred_prompt_builder
+        self.prompt_builder = get_alfred_prompt_builder()
         self.metrics = PipelineMetrics()
         self.start_time = None
 
@@ -101,9 +101,23 @@ STANDARD_CHART_SIZES = {
     "tall_chart": ChartSize(inches_to_emu(3), inches_to_emu(6)),
 }
 
+# Fallback placeholder dimensions used when the original size cannot be read
+_FALLBACK_W = inches_to_emu(4)
+_FALLBACK_H = inches_to_emu(3)
+
 # Size Calculation Functions
 
 
+def _extract_wh(size: Dict[str, Any], default_w: int = 0, default_h: int = 0) -> Tuple[int, int]:
+    """Flatten a Slides API size dict into a (width, height) EMU tuple."""
+    width = size.get("width")
+    height = size.get("height")
+    return (
+        int(width.get("magnitude", default_w)) if width else default_w,
+        int(height.get("magnitude", default_h)) if height else default_h,
+    )
+
+
 def calculate_size_from_config(
     original_size: Dict[str, Any], sizing_config: Dict[str, Any], correlation_id: str = None
 ) -> ChartSize:
@@ -123,8 +137,7 @@ def calculate_size_from_config(
 
     try:
         # Extract original dimensions
-        orig_width = original_size.get("width", {}).get("magnitude", 0)
-        orig_height = original_size.get("height", {}).get("magnitude", 0)
+        orig_width, orig_height = _extract_wh(original_size)
 
         # Method 1: Absolute size specified
         if "width_emu" in sizing_config and "height_emu" in sizing_config:
@@ -179,14 +192,16 @@ def calculate_size_from_config(
 
         # Default: Use original size
         logger.info(f"[{correlation_id}] Using original size: {orig_width} x {orig_height} EMU")
-        return ChartSize(int(orig_width), int(orig_height))
+        return ChartSize(orig_width, orig_height)
 
     except Exception as e:
         logger.error(f"[{correlation_id}] Size calculation failed: {e}")
-        # Fallback to original size
-        orig_width = original_size.get("width", {}).get("magnitude", inches_to_emu(4))
-        orig_height = original_size.get("height", {}).get("magnitude", inches_to_emu(3))
-        return ChartSize(int(orig_width), int(orig_height))
+        # Fallback to original size, or the default placeholder size if that is unreadable too
+        try:
+            orig_width, orig_height = _extract_wh(original_size, _FALLBACK_W, _FALLBACK_H)
+        except (AttributeError, TypeError, ValueError):
+            orig_width, orig_height = _FALLBACK_W, _FALLBACK_H
+        return ChartSize(orig_width, orig_height)
 
 
 def calculate_transform_for_size_change(
@@ -7,7 +7,8 @@ import logging
 import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from .feature_flags import get_feature_manager
 from .google_api_wrapper import OperationResult, get_api_wrapper
@@ -78,24 +79,23 @@ class ChartTypeDetector:
     ]
 
     @classmethod
-    def detect_chart_type(cls, placeholder_text: str, inner_text: str = "") -> Tuple[str, int]:
+    def detect_chart_type(cls, text_lower: str) -> Tuple[str, int]:
         """
-        Detect chart type from placeholder text and inner text.
+        Detect chart type from the lowercased placeholder inner text.
+
+        The placeholder identifier is the inner text with its braces stripped, so
+        scanning the inner text alone covers both.
 
         Args:
-            placeholder_text: The placeholder identifier (e.g., "monthly_sales_chart")
-            inner_text: The actual text content inside the placeholder
+            text_lower: The placeholder inner text, already lowercased (e.g., "{{monthly_sales_chart}}")
 
         Returns:
             Tuple of (chart_type, confidence_score)
         """
 
-        # Combine both texts for analysis
-        combined_text = f"{placeholder_text} {inner_text}".lower()
-
         for pattern, chart_type, priority in cls.CHART_TYPE_PATTERNS:
-            if re.search(pattern, combined_text):
-                logger.debug(f"Detected chart type '{chart_type}' from pattern '{pattern}' in '{combined_text}'")
+            if re.search(pattern, text_lower):
+                logger.debug("Detected chart type '%s' from pattern '%s' in '%s'", chart_type, pattern, text_lower)
                 return chart_type, priority
 
         return "unknown", 0
@@ -104,12 +104,23 @@ class ChartTypeDetector:
 class TemplatePlaceholderAnalyzer:
     """Analyzes Google Slides templates to discover and classify placeholders."""
 
+    # Process-wide singletons, resolved once and shared by every analyzer instance
+    _api_wrapper = None
+    _feature_manager = None
+
     def __init__(self, presentation_id: str):
         self.presentation_id = presentation_id
-        self.api_wrapper = get_api_wrapper()
-        self.feature_manager = get_feature_manager()
+
+        cls = type(self)
+        if cls._api_wrapper is None:
+            cls._api_wrapper = get_api_wrapper()
+        if cls._feature_manager is None:
+            cls._feature_manager = get_feature_manager()
+        self.api_wrapper = cls._api_wrapper
+        self.feature_manager = cls._feature_manager
         self.placeholders: Dict[str, PlaceholderInfo] = {}
         self.chart_placeholders: Dict[str, PlaceholderInfo] = {}
+        self._top_placeholder: Optional[PlaceholderInfo] = None
 
     def discover_all_placeholders(self, correlation_id: Optional[str] = None) -> OperationResult:
         """
@@ -135,10 +146,11 @@ class TemplatePlaceholderAnalyzer:
         for object_id, info in raw_placeholders.items():
             if info and info.get("inner_text"):
                 inner_text = info["inner_text"]
+                inner_text_lower = inner_text.lower()
                 page_id = info.get("page_id")
 
                 # Determine placeholder type
-                placeholder_type = self._classify_placeholder_type(inner_text)
+                placeholder_type = self._classify_placeholder_type(inner_text_lower)
 
                 # Extract placeholder text (remove braces)
                 placeholder_text = inner_text.strip("{}")
@@ -147,7 +159,7 @@ class TemplatePlaceholderAnalyzer:
                 chart_type_hint = None
                 priority = 0
                 if placeholder_type == PlaceholderType.CHART:
-                    chart_type_hint, priority = ChartTypeDetector.detect_chart_type(placeholder_text, inner_text)
+                    chart_type_hint, priority = ChartTypeDetector.detect_chart_type(inner_text_lower)
 
                 placeholder_info = PlaceholderInfo(
                     object_id=object_id,
@@ -167,6 +179,7 @@ class TemplatePlaceholderAnalyzer:
         # Store results
         self.placeholders = processed_placeholders
         self.chart_placeholders = chart_placeholders
+        self._top_placeholder = max(chart_placeholders.values(), key=lambda p: p.priority, default=None)
 
         # Update API result with processed information
         api_result.details.update(
@@ -185,9 +198,8 @@ class TemplatePlaceholderAnalyzer:
 
         return api_result
 
-    def _classify_placeholder_type(self, inner_text: str) -> PlaceholderType:
-        """Classify placeholder type based on inner text."""
-        inner_text_lower = inner_text.lower()
+    def _classify_placeholder_type(self, inner_text_lower: str) -> PlaceholderType:
+        """Classify placeholder type based on the lowercased inner text."""
 
         # Chart indicators
         chart_keywords = ["chart", "graph", "plot", "visualization", "aov", "sales", "orders", "demographic"]
@@ -206,9 +218,14 @@ class TemplatePlaceholderAnalyzer:
 
         return PlaceholderType.UNKNOWN
 
-    def get_chart_placeholders(self) -> Dict[str, PlaceholderInfo]:
-        """Get only chart placeholders."""
-        return self.chart_placeholders.copy()
+    def get_chart_placeholders(self) -> Mapping[str, PlaceholderInfo]:
+        """
+        Get only chart placeholders.
+
+        Returns a read-only view over the analyzer's chart placeholders rather than
+        a copy. Callers that need to mutate the result should take ``dict(view)``.
+        """
+        return MappingProxyType(self.chart_placeholders)
 
     def find_placeholder_for_chart_type(
         self, chart_data_type: str, correlation_id: Optional[str] = None
@@ -236,7 +253,7 @@ class TemplatePlaceholderAnalyzer:
             normalized_placeholder = placeholder_text.lower().replace(" ", "_").replace("-", "_")
 
             if normalized_data_type in normalized_placeholder or normalized_placeholder in normalized_data_type:
-                logger.debug(f"[{correlation_id}] Exact match: '{chart_data_type}' -> '{placeholder_text}'")
+                logger.debug("[%s] Exact match: '%s' -> '%s'", correlation_id, chart_data_type, placeholder_text)
                 return placeholder_info
 
         # Try chart type hint matches
@@ -259,14 +276,18 @@ class TemplatePlaceholderAnalyzer:
 
         if best_match:
             logger.debug(
-                f"[{correlation_id}] Type hint match: '{chart_data_type}' -> '{best_match.placeholder_text}' "
-                f"(hint: {best_match.chart_type_hint}, priority: {best_priority})"
+                "[%s] Type hint match: '%s' -> '%s' (hint: %s, priority: %s)",
+                correlation_id,
+                chart_data_type,
+                best_match.placeholder_text,
+                best_match.chart_type_hint,
+                best_priority,
             )
             return best_match
 
         # Fallback: return highest priority chart placeholder
-        if self.chart_placeholders:
-            fallback = max(self.chart_placeholders.values(), key=lambda p: p.priority)
+        fallback = self._top_placeholder
+        if fallback:
             logger.info(
                 f"[{correlation_id}] Fallback match: '{chart_data_type}' -> '{fallback.placeholder_text}' "
                 f"(priority: {fallback.priority})"
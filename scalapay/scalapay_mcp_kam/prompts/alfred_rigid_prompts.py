@@ -3,193 +3,350 @@ Rigid Alfred Prompt System - Data-specific prompt templates
 Based on schema registry for consistent Alfred responses.
 """
 
+import asyncio
+import functools
 import json
-from typing import Any, Dict, Optional
+import logging
+import re
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from ..data_schemas.alfred_schema_registry import ALFRED_DATA_REQUIREMENTS, ChartType, DataRequirement
 
+logger = logging.getLogger(__name__)
 
-class AlfredPromptBuilder:
-    """Builder for data-specific Alfred prompts with rigid validation"""
+# Module-level binding of the read-only registry for single-lookup access
+_REG = ALFRED_DATA_REQUIREMENTS
+
+# Supported data type -> chart type value, materialized once from the static registry
+_SUPPORTED_TYPES: Mapping[str, str] = MappingProxyType({dt: req.chart_type.value for dt, req in _REG.items()})
+
+# Validation rule types, interned so dispatch lookups hit on identity
+_REQUIRED = sys.intern("required")
+_NUMERIC = sys.intern("numeric")
+_PATTERN = sys.intern("pattern")
+_RANGE = sys.intern("range")
+
+# Checklist line formats for each renderable validation rule type
+_VAL_FMT = {
+    _REQUIRED: "- Field '{p}' must be present",
+    _NUMERIC: "- Field '{p}' must be numeric (int/float)",
+    _PATTERN: "- Field '{p}' must match pattern: {v}",
+    _RANGE: "- Field '{p}' must be between {v[0]} and {v[1]}",
+}
 
-    def __init__(self):
-        self.registry = ALFRED_DATA_REQUIREMENTS
-        self.base_instruction = """
-CRITICAL SYSTEM REQUIREMENTS:
+# Universal output rules, shared by the builder's base instruction and the rigid templates
+_SHARED_CONSTRAINTS = """CRITICAL SYSTEM REQUIREMENTS:
 1. You MUST output EXACT JSON format specified below
 2. NO additional text, explanations, or markdown formatting
 3. ALL numeric values must be actual numbers (int/float), never strings
 4. NO null values - use 0 for missing data
 5. Follow the EXACT field names and structure provided
 6. Paragraph must be analytical and substantive (minimum 50 characters)
+"""
 
+# System instruction shared by every rigid prompt
+_BASE_INSTRUCTION = "\n" + _SHARED_CONSTRAINTS + """
 VALIDATION CHECKLIST BEFORE RESPONDING:
-✓ Output is valid JSON (no syntax errors)
-✓ All required fields are present
-✓ All numbers are numeric types, not strings
-✓ Structure matches template exactly
-✓ No extra fields outside the template
-✓ Paragraph provides meaningful analysis
+- Output is valid JSON (no syntax errors)
+- All required fields are present
+- All numbers are numeric types, not strings
+- Structure matches template exactly
+- No extra fields outside the template
+- Paragraph provides meaningful analysis
 """
 
-    def build_prompt(
-        self,
-        data_type: str,
-        merchant_token: str,
-        starting_date: str,
-        end_date: str,
-        additional_context: Optional[str] = None,
-    ) -> str:
-        """Build rigid prompt for specific data type"""
-
-        requirement = self.registry.get(data_type)
-        if not requirement:
-            raise ValueError(f"Unsupported data type: {data_type}")
-
-        # Build data type specific instructions
-        specific_instructions = self._build_specific_instructions(requirement)
-
-        # Build exact output template
-        output_template = self._build_output_template(requirement)
-
-        # Build validation requirements
-        validation_section = self._build_validation_section(requirement)
-
-        # Build transformation hints
-        transformation_section = self._build_transformation_section(requirement)
-
-        # Assemble complete prompt
-        prompt = f"""{self.base_instruction}
-
-DATA REQUEST: {data_type}
-MERCHANT: {merchant_token}
-DATE RANGE: {starting_date} to {end_date}
-CHART TYPE: {requirement.chart_type.value}
-
-{specific_instructions}
-
-{transformation_section}
-
-EXACT OUTPUT TEMPLATE (DO NOT DEVIATE):
-{output_template}
-
-{validation_section}
-
-EXECUTE DATA RETRIEVAL:
-Find the exact data for merchant "{merchant_token}" from {starting_date} to {end_date}.
-Focus specifically on: {data_type}
-
-Your response must be ONLY the JSON object matching the template above."""
-
-        if additional_context:
-            prompt += f"\n\nADDITIONAL CONTEXT: {additional_context}"
-
-        return prompt
-
-    def _build_specific_instructions(self, requirement: DataRequirement) -> str:
-        """Build data-type specific instructions"""
-
-        instructions_map = {
-            ChartType.TIME_SERIES: """
+# Chart-type specific data requirements
+_SPECIFIC_INSTRUCTIONS: Dict[ChartType, str] = {
+    ChartType.TIME_SERIES: """
 TIME SERIES DATA REQUIREMENTS:
 - Use chronological month ordering (Jan, Feb, Mar, etc.)
 - Include multiple years for comparison
 - Ensure consistent date formatting
 - Fill missing months with 0 values
 """,
-            ChartType.BAR_CHART: """
+    ChartType.BAR_CHART: """
 BAR CHART DATA REQUIREMENTS:
 - Organize data for clear categorical comparison
 - Use consistent category naming
 - Ensure all values are positive numbers
 - Include meaningful category labels
 """,
-            ChartType.STACKED_BAR: """
+    ChartType.STACKED_BAR: """
 STACKED BAR CHART REQUIREMENTS:
 - Each time period must have all category breakdowns
 - Categories should be consistent across all periods
 - Values represent component parts of totals
 - Use standardized category names
 """,
-            ChartType.LINE_CHART: """
+    ChartType.LINE_CHART: """
 LINE CHART DATA REQUIREMENTS:  
 - Chronological data points for trend analysis
 - Use consistent time intervals
 - Values should show progression over time
 - Include sufficient data points for trend visibility
 """,
-            ChartType.PIE_CHART: """
+    ChartType.PIE_CHART: """
 PIE CHART DATA REQUIREMENTS:
 - Values represent parts of a whole
 - All values should be positive
 - Categories should be mutually exclusive
 - Include percentage or count breakdowns
 """,
-            ChartType.DEMOGRAPHIC: """
+    ChartType.DEMOGRAPHIC: """
 DEMOGRAPHIC DATA REQUIREMENTS:
 - Use standard demographic categories
 - Percentages should sum to 100% within each group
 - Age ranges: 18-24, 25-34, 35-44, 45-54, 55-64
 - Gender: M (Male), F (Female)
 """,
-        }
+}
 
-        return instructions_map.get(requirement.chart_type, "")
 
-    def _build_output_template(self, requirement: DataRequirement) -> str:
-        """Build exact JSON output template"""
-        template = json.dumps(requirement.data_structure_template, indent=2, ensure_ascii=False)
+def _dumps_template(obj: Any) -> str:
+    """
+    Serialize a registry template for a prompt.
 
-        # Add example if available
-        if requirement.example_response:
-            example = json.dumps(requirement.example_response, indent=2, ensure_ascii=False)
-            template += f"\n\nEXAMPLE OUTPUT:\n{example}"
+    Registered templates are expected to be ASCII, which takes the default (fastest) encoder path.
+    Templates that do contain non-ASCII text are re-encoded with ensure_ascii=False so the LLM
+    sees the characters themselves rather than \\u escapes.
+    """
+    rendered = json.dumps(obj, indent=2)
+    if "\\u" in rendered:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return rendered
 
-        return template
 
-    def _build_validation_section(self, requirement: DataRequirement) -> str:
-        """Build validation requirements section"""
+def _render_output_template(requirement: DataRequirement, include_example: bool = True) -> str:
+    """Render the exact JSON output template, followed by the example response if available"""
+    template = _dumps_template(requirement.data_structure_template)
+    if include_example and requirement.example_response:
+        example = _dumps_template(requirement.example_response)
+        template += f"\n\nEXAMPLE OUTPUT:\n{example}"
+    return template
 
-        validation_text = "MANDATORY VALIDATION REQUIREMENTS:\n"
 
-        for rule in requirement.validation_rules:
-            if rule.rule_type == "required":
-                validation_text += f"✓ Field '{rule.field_path}' must be present\n"
-            elif rule.rule_type == "numeric":
-                validation_text += f"✓ Field '{rule.field_path}' must be numeric (int/float)\n"
-            elif rule.rule_type == "pattern":
-                validation_text += f"✓ Field '{rule.field_path}' must match pattern: {rule.rule_value}\n"
-            elif rule.rule_type == "range":
-                min_val, max_val = rule.rule_value
-                validation_text += f"✓ Field '{rule.field_path}' must be between {min_val} and {max_val}\n"
+# Serialized JSON templates are static per data type, so render them once at import
+_OUTPUT_TEMPLATES: Dict[str, str] = {dt: _render_output_template(req) for dt, req in _REG.items()}
+_BARE_OUTPUT_TEMPLATES: Dict[str, str] = {dt: _render_output_template(req, False) for dt, req in _REG.items()}
+_FALLBACK_TEMPLATES: Dict[str, str] = {
+    dt: json.dumps(req.data_structure_template, indent=2) for dt, req in _REG.items()
+}
 
-        if requirement.expected_data_size:
-            min_size = requirement.expected_data_size.get("min", 0)
-            max_size = requirement.expected_data_size.get("max", "unlimited")
-            validation_text += f"✓ structured_data must contain {min_size}-{max_size} entries\n"
 
-        return validation_text
+def _render_validation_section(requirement: DataRequirement) -> str:
+    """Render the validation requirements section"""
 
-    def _build_transformation_section(self, requirement: DataRequirement) -> str:
-        """Build transformation hints section"""
+    parts = ["MANDATORY VALIDATION REQUIREMENTS:"]
 
-        if not requirement.transformation_hints:
-            return ""
+    for rule in requirement.validation_rules:
+        fmt = _VAL_FMT.get(rule.rule_type)
+        if fmt:
+            parts.append(fmt.format(p=rule.field_path, v=rule.rule_value))
+
+    if requirement.expected_data_size:
+        min_size = requirement.expected_data_size.get("min", 0)
+        max_size = requirement.expected_data_size.get("max", "unlimited")
+        parts.append(f"- structured_data must contain {min_size}-{max_size} entries")
+
+    return "\n".join(parts) + "\n"
+
+
+def _render_transformation_section(requirement: DataRequirement) -> str:
+    """Render the transformation hints section"""
+
+    if not requirement.transformation_hints:
+        return ""
+
+    parts = ["DATA TRANSFORMATION REQUIREMENTS:"]
+    parts.extend(f"* {hint}" for hint in requirement.transformation_hints)
+
+    return "\n".join(parts) + "\n"
+
+
+# Validation and transformation sections only depend on the static registry entry
+_VALIDATION_BODY: Dict[str, str] = {dt: _render_validation_section(req) for dt, req in _REG.items()}
+_TRANSFORM_BODY: Dict[str, str] = {dt: _render_transformation_section(req) for dt, req in _REG.items()}
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding():
+    """Load the tokenizer once, on first use; None if tiktoken or its encoding file is unavailable"""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning("tiktoken unavailable, estimating prompt tokens from length: %s", e)
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _static_body(data_type: str, include_example: bool = True) -> str:
+    """Render the prompt prefix shared by every request for a data type (cached per process)"""
 
-        hints_text = "DATA TRANSFORMATION REQUIREMENTS:\n"
-        for hint in requirement.transformation_hints:
-            hints_text += f"• {hint}\n"
+    requirement = _REG.get(data_type)
+    if requirement is None:
+        raise ValueError(f"Unsupported data type: {data_type}")
 
-        return hints_text
+    output_template = _OUTPUT_TEMPLATES[data_type] if include_example else _BARE_OUTPUT_TEMPLATES[data_type]
+    return "\n\n".join(
+        (
+            f"{_BASE_INSTRUCTION}\nCHART TYPE: {requirement.chart_type.value}",
+            _SPECIFIC_INSTRUCTIONS.get(requirement.chart_type, ""),
+            _TRANSFORM_BODY[data_type],
+            f"EXACT OUTPUT TEMPLATE (DO NOT DEVIATE):\n{output_template}",
+            _VALIDATION_BODY[data_type],
+        )
+    )
+
+
+class AlfredPromptBuilder:
+    """
+    Builder for data-specific Alfred prompts with rigid validation.
+
+    All prompt state lives in module-level constants, so instances carry no attributes.
+    """
+
+    __slots__ = ()
+
+    def build_prompt(
+        self,
+        data_type: str,
+        merchant_token: str,
+        starting_date: str,
+        end_date: str,
+        additional_context: Optional[str] = None,
+    ) -> str:
+        """Build rigid prompt for specific data type"""
+        return "\n".join(
+            self.build_prompt_parts(data_type, merchant_token, starting_date, end_date, additional_context)
+        )
+
+    async def abuild_prompt(
+        self,
+        data_type: str,
+        merchant_token: str,
+        starting_date: str,
+        end_date: str,
+        additional_context: Optional[str] = None,
+    ) -> str:
+        """
+        Build rigid prompt from async handlers without blocking the event loop.
+
+        Prompt assembly runs in a worker thread. For many merchants, prefer a single offloaded
+        ``build_prompts_batch`` call over one ``abuild_prompt`` per merchant.
+        """
+        return await asyncio.to_thread(
+            self.build_prompt, data_type, merchant_token, starting_date, end_date, additional_context
+        )
+
+    def count_tokens(self, prompt: str) -> int:
+        """Count prompt tokens with the cl100k_base encoding (about 4 chars per token if it can't be loaded)"""
+        encoding = _encoding()
+        if encoding is None:
+            return len(prompt) // 4
+        return len(encoding.encode(prompt))
+
+    def build_prompt_parts(
+        self,
+        data_type: str,
+        merchant_token: str,
+        starting_date: str,
+        end_date: str,
+        additional_context: Optional[str] = None,
+        include_example: bool = True,
+    ) -> Tuple[str, str]:
+        """
+        Build rigid prompt split into a cacheable prefix and a per-request suffix.
+
+        The prefix only depends on the data type, so callers can mark it for provider-side
+        prompt caching (e.g. ``cache_control: {"type": "ephemeral"}``) and send the suffix after it.
+
+        Returns:
+            Tuple of (cacheable_prefix, volatile_suffix)
+        """
+
+        # Data-type invariant sections are rendered once and reused across merchants
+        prefix = self._build_static_body(data_type, include_example)
+
+        return prefix, self._build_request_suffix(
+            data_type, merchant_token, starting_date, end_date, additional_context
+        )
+
+    def build_prompts_batch(
+        self,
+        data_type: str,
+        merchant_tokens: Iterable[str],
+        starting_date: str,
+        end_date: str,
+        additional_context: Optional[str] = None,
+    ) -> List[str]:
+        """Build rigid prompts for several merchants, resolving the shared prefix only once"""
+
+        prefix = self._build_static_body(data_type, True) + "\n"
+
+        return [
+            prefix + self._build_request_suffix(data_type, merchant, starting_date, end_date, additional_context)
+            for merchant in merchant_tokens
+        ]
+
+    def _build_request_suffix(
+        self,
+        data_type: str,
+        merchant_token: str,
+        starting_date: str,
+        end_date: str,
+        additional_context: Optional[str] = None,
+    ) -> str:
+        """Build the per-request part of the prompt (merchant, dates and additional context)"""
+
+        header = f"DATA REQUEST: {data_type}\nMERCHANT: {merchant_token}\nDATE RANGE: {starting_date} to {end_date}"
+        exec_block = (
+            f"EXECUTE DATA RETRIEVAL:\n"
+            f'Find the exact data for merchant "{merchant_token}" from {starting_date} to {end_date}.\n'
+            f"Focus specifically on: {data_type}\n\n"
+            "Your response must be ONLY the JSON object matching the template above."
+        )
+
+        if additional_context:
+            return "\n\n".join((header, exec_block, f"ADDITIONAL CONTEXT: {additional_context}"))
+
+        return "\n\n".join((header, exec_block))
+
+    def _build_static_body(self, data_type: str, include_example: bool = True) -> str:
+        """Build the cacheable prompt prefix, which depends only on the data type"""
+        return _static_body(data_type, include_example)
+
+    def clear_cache(self) -> None:
+        """Drop cached prompt bodies (e.g. after the registry is modified in tests)"""
+        _static_body.cache_clear()
+
+    def _build_specific_instructions(self, requirement: DataRequirement) -> str:
+        """Build data-type specific instructions"""
+        return _SPECIFIC_INSTRUCTIONS.get(requirement.chart_type, "")
+
+    def _build_output_template(self, data_type: str, include_example: bool = True) -> str:
+        """Get the precomputed exact JSON output template (with example, if available and requested)"""
+        return _OUTPUT_TEMPLATES[data_type] if include_example else _BARE_OUTPUT_TEMPLATES[data_type]
+
+    def _build_validation_section(self, data_type: str) -> str:
+        """Get the precomputed validation requirements section"""
+        return _VALIDATION_BODY[data_type]
+
+    def _build_transformation_section(self, data_type: str) -> str:
+        """Get the precomputed transformation hints section"""
+        return _TRANSFORM_BODY[data_type]
 
     def get_fallback_prompt(self, data_type: str, original_response: str, errors: list) -> str:
         """Build fallback prompt when initial response fails validation"""
 
-        requirement = self.registry.get(data_type)
-        if not requirement:
+        template_str = _FALLBACK_TEMPLATES.get(data_type)
+        if template_str is None:
             return ""
 
-        error_text = "\n".join([f"- {error}" for error in errors])
+        error_text = "\n".join(f"- {error}" for error in errors)
 
         return f"""
 RESPONSE CORRECTION REQUIRED
@@ -208,139 +365,122 @@ CORRECTION INSTRUCTIONS:
 5. Verify JSON syntax is valid
 
 REQUIRED OUTPUT TEMPLATE:
-{json.dumps(requirement.data_structure_template, indent=2)}
+{template_str}
 
 CORRECTED RESPONSE (JSON only):
 """
 
-    def get_supported_data_types(self) -> Dict[str, str]:
-        """Get mapping of supported data types to chart types"""
-        return {data_type: req.chart_type.value for data_type, req in self.registry.items()}
+    def get_supported_data_types(self) -> Mapping[str, str]:
+        """Get read-only mapping of supported data types to chart types (use dict(...) for a mutable copy)"""
+        return _SUPPORTED_TYPES
+
+
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# Data-specific requirement snippets shared by several templates
+# (universal rules come from _SHARED_CONSTRAINTS)
+_SHARED_RULES = {
+    "counts": "values are integer counts >= 0",
+    "trends": "paragraph analyzes the trends over time",
+}
+
+
+def _gen_month_year_template(years: Tuple[str, ...] = ("2022", "2023", "2024")) -> Dict[str, Any]:
+    """Generate the month -> year -> value structure for monthly time series"""
+    return {m: {y: 0 for y in years} for m in _MONTHS}
+
 
+def _gen_year_month_keys(start_year: int, months: int) -> Tuple[str, ...]:
+    """Generate consecutive "YYYY-MM" keys starting from January of start_year"""
+    return tuple(f"{start_year + i // 12}-{i % 12 + 1:02d}" for i in range(months))
 
-# Specific prompt templates for each data type
+
+def _compact_template(title: str, structured_data: Dict[str, Any], rules: Tuple[str, ...]) -> str:
+    """Compose a rigid template from the shared constraints, a structure skeleton and its requirements"""
+    skeleton = json.dumps({"structured_data": structured_data, "paragraph": "..."})
+    return (
+        f"\n{title}\n\n{_SHARED_CONSTRAINTS}\n"
+        f"OUTPUT FORMAT (0 = numeric value):\n{skeleton}\n\n"
+        f"REQUIREMENTS: {'; '.join(rules)}\n"
+    )
+
+
+# Rigid prompt templates per data type, composed from the shared constraints and generated skeletons
 RIGID_PROMPT_TEMPLATES = {
-    "monthly sales over time": """
-MONTHLY SALES TIME SERIES DATA EXTRACTION
-
-CRITICAL OUTPUT FORMAT:
-{{
-    "structured_data": {{
-        "Jan": {{"2022": numeric_value, "2023": numeric_value, "2024": numeric_value}},
-        "Feb": {{"2022": numeric_value, "2023": numeric_value, "2024": numeric_value}},
-        "Mar": {{"2022": numeric_value, "2023": numeric_value, "2024": numeric_value}},
-        "Apr": {{"2022": numeric_value, "2023": numeric_value, "2024": numeric_value}},
-        "May": {{"2022": numeric_value, "2023": numeric_value, "2024": numeric_value}},
-        "Jun": {{"2022": numeric_value, "2023": numeric_value, "2024": numeric_value}},
-        "Jul": {{"2022": numeric_value, "2023": numeric_value, "2024": numeric_value}},
-        "Aug": {{"2022": numeric_value, "2023": numeric_value, "2024": numeric_value}},
-        "Sep": {{"2022": numeric_value, "2023": numeric_value, "2024": numeric_value}},
-        "Oct": {{"2022": numeric_value, "2023": numeric_value, "2024": numeric_value}},
-        "Nov": {{"2022": numeric_value, "2023": numeric_value, "2024": numeric_value}},
-        "Dec": {{"2022": numeric_value, "2023": numeric_value, "2024": numeric_value}}
-    }},
-    "paragraph": "Comprehensive analysis of monthly sales trends, highlighting seasonal patterns, year-over-year growth, peak performance periods, and business insights."
-}}
-
-MANDATORY REQUIREMENTS:
-- Month names: EXACTLY "Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"  
-- Years: EXACTLY "2022", "2023", "2024" (strings for consistency)
-- Values: Numbers only (int/float), never strings like "45"
-- Missing data: Use 0, never null
-- Paragraph: Minimum 80 characters of analytical content
-""",
-    "monthly orders by user type": """
-USER TYPE ORDERS STACKED DATA EXTRACTION
-
-CRITICAL OUTPUT FORMAT:
-{{
-    "structured_data": {{
-        "Oct-22": {{"Network": numeric_value, "Returning": numeric_value, "New": numeric_value}},
-        "Nov-22": {{"Network": numeric_value, "Returning": numeric_value, "New": numeric_value}},
-        "Dec-22": {{"Network": numeric_value, "Returning": numeric_value, "New": numeric_value}},
-        "Jan-23": {{"Network": numeric_value, "Returning": numeric_value, "New": numeric_value}},
-        "Feb-23": {{"Network": numeric_value, "Returning": numeric_value, "New": numeric_value}},
-        "Mar-23": {{"Network": numeric_value, "Returning": numeric_value, "New": numeric_value}}
-    }},
-    "paragraph": "Analysis of user type distribution across order periods, showing Network user dominance, returning customer patterns, and new user acquisition trends."
-}}
-
-MANDATORY REQUIREMENTS:
-- Date format: EXACTLY "MMM-YY" (e.g., "Oct-22", "Nov-22")
-- User types: EXACTLY "Network", "Returning", "New" (exact spelling)
-- Values: Integer counts >= 0
-- Include at least 6 months of data
-- Paragraph must explain user type dynamics and trends
-""",
-    "scalapay users demographic in percentages": """
-DEMOGRAPHIC PERCENTAGE BREAKDOWN EXTRACTION
-
-CRITICAL OUTPUT FORMAT:
-{{
-    "structured_data": {{
-        "Age in percentages": {{
-            "18-24": numeric_value,
-            "25-34": numeric_value,
-            "35-44": numeric_value,
-            "45-54": numeric_value,
-            "55-64": numeric_value
-        }},
-        "Gender in percentages": {{
-            "M": numeric_value,
-            "F": numeric_value
-        }},
-        "Card type in percentages": {{
-            "credit": numeric_value,
-            "debit": numeric_value,
-            "prepaid": numeric_value
-        }}
-    }},
-    "paragraph": "Demographic analysis revealing user age distribution, gender composition, and card type preferences, with insights into target market characteristics."
-}}
-
-MANDATORY REQUIREMENTS:
-- Age categories: EXACTLY "18-24", "25-34", "35-44", "45-54", "55-64"
-- Gender categories: EXACTLY "M", "F" 
-- Card types: EXACTLY "credit", "debit", "prepaid"
-- Percentages: Integer values that sum to 100 within each category
-- All three demographic categories must be present
-""",
-    "AOV": """
-AVERAGE ORDER VALUE TREND EXTRACTION
-
-CRITICAL OUTPUT FORMAT:
-{{
-    "structured_data": {{
-        "2023-01": numeric_value,
-        "2023-02": numeric_value,
-        "2023-03": numeric_value,
-        "2023-04": numeric_value,
-        "2023-05": numeric_value,
-        "2023-06": numeric_value,
-        "2023-07": numeric_value,
-        "2023-08": numeric_value,
-        "2023-09": numeric_value,
-        "2023-10": numeric_value,
-        "2023-11": numeric_value,
-        "2023-12": numeric_value,
-        "2024-01": numeric_value,
-        "2024-02": numeric_value,
-        "2024-03": numeric_value,
-        "2024-04": numeric_value,
-        "2024-05": numeric_value,
-        "2024-06": numeric_value
-    }},
-    "paragraph": "Average Order Value trend analysis showing monthly progression, seasonal variations, customer spending patterns, and value optimization opportunities."
-}}
-
-MANDATORY REQUIREMENTS:
-- Date format: EXACTLY "YYYY-MM" (e.g., "2023-01", "2024-02")
-- Values: Float numbers with 2 decimal places representing currency amounts
-- Include at least 12 months of chronological data
-- Paragraph must analyze AOV trends and business implications
-""",
+    "monthly sales over time": _compact_template(
+        "MONTHLY SALES TIME SERIES DATA EXTRACTION",
+        _gen_month_year_template(),
+        (
+            "month keys EXACTLY Jan..Dec, year keys EXACTLY the strings shown",
+            _SHARED_RULES["trends"],
+        ),
+    ),
+    "monthly orders by user type": _compact_template(
+        "USER TYPE ORDERS STACKED DATA EXTRACTION",
+        {
+            period: {"Network": 0, "Returning": 0, "New": 0}
+            for period in ("Oct-22", "Nov-22", "Dec-22", "Jan-23", "Feb-23", "Mar-23")
+        },
+        (
+            'period keys EXACTLY "MMM-YY", user types EXACTLY "Network", "Returning", "New"',
+            "at least 6 months",
+            _SHARED_RULES["counts"],
+            _SHARED_RULES["trends"],
+        ),
+    ),
+    "scalapay users demographic in percentages": _compact_template(
+        "DEMOGRAPHIC PERCENTAGE BREAKDOWN EXTRACTION",
+        {
+            "Age in percentages": dict.fromkeys(("18-24", "25-34", "35-44", "45-54", "55-64"), 0),
+            "Gender in percentages": dict.fromkeys(("M", "F"), 0),
+            "Card type in percentages": dict.fromkeys(("credit", "debit", "prepaid"), 0),
+        },
+        (
+            "all three categories and EXACTLY the keys shown",
+            "integer percentages summing to 100 within each category",
+        ),
+    ),
+    "AOV": _compact_template(
+        "AVERAGE ORDER VALUE TREND EXTRACTION",
+        dict.fromkeys(_gen_year_month_keys(2023, 18), 0),
+        (
+            'keys EXACTLY "YYYY-MM", at least 12 chronological months',
+            "values are currency floats with 2 decimals",
+            _SHARED_RULES["trends"],
+        ),
+    ),
 }
 
 
-# Global prompt builder instance
-alfred_prompt_builder = AlfredPromptBuilder()
+def get_rigid_template(data_type: str) -> Optional[str]:
+    """Get the rigid prompt template for a data type, if one is defined"""
+    return RIGID_PROMPT_TEMPLATES.get(data_type)
+
+
+# Template drift markers: leftover str.format escapes ("{{") or unfilled "{name}" fields.
+# Templates are used verbatim, so either would reach the LLM as literal text.
+_TEMPLATE_DRIFT_RE = re.compile(r"\{\{|\{[A-Za-z_]\w*\}")
+
+
+def _validate_templates() -> None:
+    """Check rigid and output templates once at import, so drift fails at startup rather than per request"""
+    templates = {**RIGID_PROMPT_TEMPLATES, **{f"output template: {dt}": t for dt, t in _OUTPUT_TEMPLATES.items()}}
+    for name, template in templates.items():
+        match = _TEMPLATE_DRIFT_RE.search(template)
+        if match:
+            raise ValueError(f"Prompt template '{name}' contains unrendered placeholder {match.group()!r}")
+        if template.count("{") != template.count("}"):
+            raise ValueError(f"Prompt template '{name}' has unbalanced braces")
+
+
+_validate_templates()
+
+
+@functools.cache
+def get_alfred_prompt_builder() -> AlfredPromptBuilder:
+    """Get the shared prompt builder instance (stateless and slot-only, so safe to share across tasks)"""
+    return AlfredPromptBuilder()
+
+
+# Global prompt builder instance (kept for backward compatibility)
+alfred_prompt_builder = get_alfred_prompt_builder()
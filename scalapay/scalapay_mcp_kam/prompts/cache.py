@@ -0,0 +1,176 @@
+"""
+Exact-match response cache for rendered prompts.
+Skips repeated LLM/agent round-trips for identical prompts (same template, merchant and dates).
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from ..config import get_config
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Default bound on in-memory entries; the least recently used entry is evicted beyond it
+DEFAULT_MAX_ENTRIES = 256
+
+
+class PromptResponseCache:
+    """
+    Cache of responses keyed on a hash of the fully rendered prompt.
+
+    The rendered prompt already contains the template text and every parameter, so a template
+    change automatically produces new keys. Entries are kept in memory (at most ``max_entries``,
+    least recently used evicted first) and, when ``cache_dir`` is set, also persisted as JSON files
+    so repeated runs (e.g. nightly reports) can reuse them.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(prompt: str) -> str:
+        """Hash a rendered prompt into a cache key"""
+        return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, prompt: str, default: Any = None) -> Any:
+        """Get the cached response for a prompt, or ``default`` if missing or expired"""
+        key = self.make_key(prompt)
+        # Popped and re-inserted on a hit, so dict order tracks recency; expired entries stay out
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            entry = self._load(key)
+
+        if entry is None or self._expired(entry[0]):
+            if entry is not None:
+                self._discard(key)
+            self.misses += 1
+            return default
+
+        self._remember(key, entry)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, prompt: str, response: Any) -> None:
+        """Store the response for a prompt"""
+        key = self.make_key(prompt)
+        entry = (time.time(), response)
+        self._entries.pop(key, None)
+        self._remember(key, entry)
+        self._store(key, entry)
+
+    async def get_or_run(
+        self,
+        prompt: str,
+        runner: Callable[[str], Awaitable[Any]],
+        is_cacheable: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Return the cached response for a prompt, running ``runner(prompt)`` on a miss.
+
+        The fresh response is only cached when ``is_cacheable(response)`` is true (default: any
+        non-empty response), so error or empty answers are retried on the next call.
+        """
+        cached = self.get(prompt, _MISSING)
+        if cached is not _MISSING:
+            logger.debug("Prompt cache hit (%s)", self.make_key(prompt))
+            return cached
+
+        response = await runner(prompt)
+        if is_cacheable(response) if is_cacheable else bool(response):
+            self.set(prompt, response)
+        else:
+            logger.debug("Not caching unusable response (%s)", self.make_key(prompt))
+        return response
+
+    def clear(self) -> None:
+        """Drop in-memory entries (persisted entries are kept)"""
+        self._entries.clear()
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds
+
+    def _remember(self, key: str, entry: Tuple[float, Any]) -> None:
+        self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _load(self, key: str) -> Optional[Tuple[float, Any]]:
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                data = json.load(f)
+            return float(data["created_at"]), data["response"]
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing, unreadable or foreign-shaped files are plain misses
+            return None
+
+    def _store(self, key: str, entry: Tuple[float, Any]) -> None:
+        if not self.cache_dir:
+            return
+        try:
+            payload = json.dumps({"created_at": entry[0], "response": entry[1]}, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.warning("Could not serialize prompt cache entry %s: %s", key, e)
+            return
+
+        # Write to a temp file and rename, so readers never see a partially written entry
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning("Could not persist prompt cache entry %s: %s", key, e)
+            if tmp_path:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+
+    def _discard(self, key: str) -> None:
+        """Forget an expired entry, including its persisted file"""
+        self._entries.pop(key, None)
+        if self.cache_dir:
+            with contextlib.suppress(OSError):
+                os.remove(self._path(key))
+
+
+# Global cache instance, created on first use when enabled
+_prompt_cache: Optional[PromptResponseCache] = None
+
+
+def get_prompt_cache() -> Optional[PromptResponseCache]:
+    """Get the global prompt response cache, or None if prompt caching is disabled"""
+    global _prompt_cache
+    config = get_config()
+    if not config.prompt_cache_enabled:
+        return None
+    if _prompt_cache is None:
+        _prompt_cache = PromptResponseCache(
+            config.prompt_cache_dir, config.prompt_cache_ttl_seconds, config.prompt_cache_max_entries
+        )
+    return _prompt_cache
@@ -3,15 +3,172 @@ Simple batch operations for Google Slides with original translateX/translateY po
 Based on the original implementation using direct Google Slides API transforms
 """
 import logging
-from typing import Dict, Optional, Any
-from googleapiclient.discovery import build
+from typing import Any, Dict, List, Optional
+
+from .utils.google_connection_manager import connection_manager
 
 logger = logging.getLogger(__name__)
 
 
 def get_slides_service():
-    """Get authenticated Google Slides service"""
-    return build('slides', 'v1')
+    """Get authenticated Google Slides service (shared, built once)"""
+    return connection_manager.get_service_sync()
+
+
+async def _execute(request):
+    """Run a googleapiclient request in a worker thread so the blocking HTTP call doesn't stall the event loop"""
+    return await connection_manager.execute(request)
+
+
+def _build_text_requests(text_mapping: Dict[str, str], pages: list) -> List[dict]:
+    """Build replaceAllText requests for text placeholders"""
+    for placeholder_text, new_value in text_mapping.items():
+        if not isinstance(new_value, str):
+            raise ValueError(f'The text from key {placeholder_text} is not a string')
+
+    return [
+        {
+            "replaceAllText": {
+                "containsText": {
+                    "text": f"{{{{{placeholder_text}}}}}"
+                },
+                "replaceText": new_value,
+                "pageObjectIds": pages
+            }
+        }
+        for placeholder_text, new_value in text_mapping.items()
+    ]
+
+
+def _build_image_requests(image_mapping: Dict[str, str], pages: list, fill: bool) -> List[dict]:
+    """Build replaceAllShapesWithImage requests for image placeholders"""
+    replace_method = 'CENTER_CROP' if fill else 'CENTER_INSIDE'
+    return [
+        {
+            "replaceAllShapesWithImage": {
+                "imageUrl": url,
+                "replaceMethod": replace_method,
+                "pageObjectIds": pages,
+                "containsText": {
+                    "text": f"{{{{{placeholder}}}}}"
+                }
+            }
+        }
+        for placeholder, url in image_mapping.items()
+    ]
+
+
+# Only the fields needed to map placeholder text to the shapes that hold it, plus their current transform
+_PLACEHOLDER_SHAPE_FIELDS = "slides(pageElements(objectId,transform,shape(text(textElements(textRun(content))))))"
+
+# Slides transforms express translation in EMU or PT; scale and shear are unitless
+_EMU_PER_UNIT = {"EMU": 1, "PT": 12700}
+
+
+async def _find_placeholder_shapes(service, presentation_id: str, placeholder_names) -> Dict[str, List[dict]]:
+    """
+    Map each placeholder name to the page elements (objectId + transform) whose text contains {{placeholder}}
+
+    Uses a single presentations().get restricted to the shape text and transform fields.
+    """
+    presentation = await _execute(service.presentations().get(
+        presentationId=presentation_id,
+        fields=_PLACEHOLDER_SHAPE_FIELDS
+    ))
+    tags = {f"{{{{{name}}}}}": name for name in placeholder_names}
+    shapes: Dict[str, List[dict]] = {}
+    for slide in presentation.get("slides", []):
+        for element in slide.get("pageElements", []):
+            text_elements = element.get("shape", {}).get("text", {}).get("textElements", [])
+            content = "".join(te.get("textRun", {}).get("content", "") for te in text_elements)
+            for tag, name in tags.items():
+                if tag in content:
+                    shapes.setdefault(name, []).append(element)
+    return shapes
+
+
+def _merged_transform(current: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    ABSOLUTE transform that keeps the shape's template geometry except where the config overrides it
+
+    Config scaleX/scaleY multiply the template scale; config translateX/translateY (in the config unit)
+    replace the template position. The result is expressed in EMU.
+    """
+    config_emu = _EMU_PER_UNIT[config.get("unit", "PT")]
+    current_emu = _EMU_PER_UNIT[current.get("unit", "EMU")]
+
+    def position(axis: str) -> float:
+        if axis in config:
+            return config[axis] * config_emu
+        return current.get(axis, 0) * current_emu
+
+    return {
+        "scaleX": current.get("scaleX", 1.0) * config.get("scaleX", 1.0),
+        "scaleY": current.get("scaleY", 1.0) * config.get("scaleY", 1.0),
+        "shearX": current.get("shearX", 0),
+        "shearY": current.get("shearY", 0),
+        "translateX": position("translateX"),
+        "translateY": position("translateY"),
+        "unit": "EMU"
+    }
+
+
+def build_transform_requests(
+    transform_config: Optional[Dict[str, Dict[str, Any]]],
+    placeholder_shapes: Dict[str, List[dict]]
+) -> List[dict]:
+    """
+    Build updatePageElementTransform requests for image placeholder shapes
+
+    The requests target the placeholder shapes themselves, so they must run before the
+    replaceAllShapesWithImage requests; the images then inherit the transformed bounds.
+    ABSOLUTE configs (the default) are merged into each shape's current transform;
+    RELATIVE configs are applied on top of it as given.
+    """
+    requests = []
+    for placeholder, config in (transform_config or {}).items():
+        elements = placeholder_shapes.get(placeholder)
+        if not elements:
+            logger.warning(f"No shape found for placeholder {{{{{placeholder}}}}}, skipping its transform")
+            continue
+
+        mode = config.get("mode", "ABSOLUTE")
+        for element in elements:
+            if mode == "RELATIVE":
+                transform = {
+                    "scaleX": config.get("scaleX", 1.0),
+                    "scaleY": config.get("scaleY", 1.0),
+                    "shearX": 0,
+                    "shearY": 0,
+                    "translateX": config.get("translateX", 0),
+                    "translateY": config.get("translateY", 0),
+                    "unit": config.get("unit", "PT")
+                }
+            else:
+                transform = _merged_transform(element.get("transform", {}), config)
+            requests.append(
+                {
+                    "updatePageElementTransform": {
+                        "objectId": element["objectId"],
+                        "transform": transform,
+                        "applyMode": mode
+                    }
+                }
+            )
+    return requests
+
+
+async def _transform_requests_for(
+    service,
+    presentation_id: str,
+    transform_config: Optional[Dict[str, Dict[str, Any]]],
+    image_mapping: Dict[str, str]
+) -> List[dict]:
+    """Look up the placeholder shapes (one API call) and build their transform requests"""
+    if not transform_config or not image_mapping:
+        return []
+    placeholder_shapes = await _find_placeholder_shapes(service, presentation_id, image_mapping.keys())
+    return build_transform_requests(transform_config, placeholder_shapes)
 
 
 async def batch_text_replace(
@@ -36,36 +193,22 @@ async def batch_text_replace(
         pages = []
     
     if ctx:
-        await ctx.info(f"🔤 Starting text replacement for {len(text_mapping)} placeholders")
-    
-    service = get_slides_service()
-    requests = []
-    
-    for placeholder_text, new_value in text_mapping.items():
-        if not isinstance(new_value, str):
-            raise ValueError(f'The text from key {placeholder_text} is not a string')
-            
-        if ctx:
-            await ctx.info(f"  📝 Replacing {{{{ {placeholder_text} }}}} → {new_value}")
-            
-        requests.append({
-            "replaceAllText": {
-                "containsText": {
-                    "text": '{{' + placeholder_text + '}}'
-                },
-                "replaceText": new_value,
-                "pageObjectIds": pages
-            }
-        })
+        # One message for all placeholders instead of an await per placeholder
+        lines = [f"🔤 Starting text replacement for {len(text_mapping)} placeholders"]
+        lines.extend(f"  📝 Replacing {{{{ {key} }}}} → {value}" for key, value in text_mapping.items())
+        await ctx.info("\n".join(lines))
+
+    requests = _build_text_requests(text_mapping, pages)
     
     if not requests:
         logger.warning("No text replacements to perform")
         return {}
         
-    response = service.presentations().batchUpdate(
+    service = get_slides_service()
+    response = await _execute(service.presentations().batchUpdate(
         presentationId=presentation_id,
         body={"requests": requests}
-    ).execute()
+    ))
     
     if ctx:
         await ctx.info(f"✅ Text replacement completed: {len(requests)} replacements")
@@ -94,13 +237,14 @@ async def batch_image_replace(
         transform_config: Optional transform parameters per placeholder:
                          {
                              "image1": {
-                                 "scaleX": 1.5,
+                                 "scaleX": 1.5,  # multiplier of the template size
                                  "scaleY": 1.2, 
                                  "translateX": 100,  # X position in PT
                                  "translateY": 150,  # Y position in PT
                                  "unit": "PT"
                              }
                          }
+                         Omitted fields keep the placeholder's template geometry.
     
     Returns:
         API response from batchUpdate
@@ -108,74 +252,52 @@ async def batch_image_replace(
     if pages is None:
         pages = []
     
-    if ctx:
-        await ctx.info(f"🖼️ Starting image replacement for {len(image_mapping)} placeholders")
-    
-    service = get_slides_service()
-    requests = []
-    replace_method = 'CENTER_CROP' if fill else 'CENTER_INSIDE'
-    
     # Step 1: Replace shapes with images
-    for placeholder, url in image_mapping.items():
-        if ctx:
-            await ctx.info(f"  🖼️ Replacing {{{{ {placeholder} }}}} → {url[:50]}...")
-            if transform_config and placeholder in transform_config:
-                config = transform_config[placeholder]
-                await ctx.info(f"    📐 Position: ({config.get('translateX', 0)}, {config.get('translateY', 0)}) PT")
-                await ctx.info(f"    📏 Scale: {config.get('scaleX', 1.0)}x{config.get('scaleY', 1.0)}")
-                
-        requests.append({
-            "replaceAllShapesWithImage": {
-                "imageUrl": url,
-                "replaceMethod": replace_method,
-                "pageObjectIds": pages,
-                "containsText": {
-                    "text": "{{" + placeholder + "}}"
-                }
-            }
-        })
+    if ctx:
+        # One message for all placeholders instead of an await per placeholder
+        lines = [f"🖼️ Starting image replacement for {len(image_mapping)} placeholders"]
+        lines.extend(f"  🖼️ Replacing {{{{ {key} }}}} → {url[:50]}..." for key, url in image_mapping.items())
+        await ctx.info("\n".join(lines))
+    if transform_config and logger.isEnabledFor(logging.DEBUG):
+        _log_transform_config(transform_config)
+
+    image_requests = _build_image_requests(image_mapping, pages, fill)
     
-    if not requests:
+    if not image_requests:
         logger.warning("No image replacements to perform")
         return {}
     
-    # Execute image replacements first
-    response = service.presentations().batchUpdate(
+    # Transforms reposition the placeholder shapes, so they go first in the same batch
+    service = get_slides_service()
+    transform_requests = await _transform_requests_for(service, presentation_id, transform_config, image_mapping)
+    response = await _execute(service.presentations().batchUpdate(
         presentationId=presentation_id,
-        body={"requests": requests}
-    ).execute()
+        body={"requests": transform_requests + image_requests}
+    ))
     
     if ctx:
-        await ctx.info(f"✅ Image replacement completed: {len(requests)} replacements")
-    
-    logger.info(f"Image replacement completed: {len(requests)} replacements")
-    
-    # Step 2: Apply transforms if provided
-    if transform_config:
-        if ctx:
-            await ctx.info("📐 Applying positioning transforms...")
-        _apply_transforms(service, presentation_id, transform_config, image_mapping.keys())
-        if ctx:
-            await ctx.info("✅ Positioning transforms applied")
+        await ctx.info(
+            f"✅ Image replacement completed: {len(image_requests)} replacements, "
+            f"{len(transform_requests)} transforms"
+        )
     
+    logger.info(
+        f"Image replacement completed: {len(image_requests)} replacements, {len(transform_requests)} transforms"
+    )
     return response
 
 
-def _apply_transforms(
-    service, 
-    presentation_id: str, 
-    transform_config: Dict[str, Dict[str, Any]], 
-    placeholder_names: list
-):
-    """
-    Apply transform operations (positioning/sizing) to replaced images
-    
-    Note: This is a simplified version that requires knowing object IDs.
-    In practice, you'd need to find the object IDs after replacement.
-    """
-    # This is where the original logic would go, but it requires object IDs
-    # which we'd need to retrieve after the image replacement
-    logger.warning("Transform application requires object IDs - implement object ID retrieval for full functionality")
+def _log_transform_config(transform_config: Dict[str, Dict[str, Any]]):
+    """Debug-log the requested position and scale for each image placeholder"""
+    for placeholder, config in transform_config.items():
+        logger.debug(
+            "Transform for %s: position (%s, %s) PT, scale %sx%s",
+            placeholder,
+            config.get('translateX', 0),
+            config.get('translateY', 0),
+            config.get('scaleX', 1.0),
+            config.get('scaleY', 1.0),
+        )
 
 
 async def batch_replace_with_positioning(
@@ -197,33 +319,48 @@ async def batch_replace_with_positioning(
         transform_configs: Transform parameters for image positioning:
                           {
                               "image1": {
-                                  "scaleX": 1.5, "scaleY": 1.2,
-                                  "translateX": 100, "translateY": 150,
+                                  "scaleX": 1.5, "scaleY": 1.2,  # multipliers of the template size
+                                  "translateX": 100, "translateY": 150,  # position
                                   "unit": "PT", "mode": "ABSOLUTE"
                               }
                           }
+                          Omitted fields keep the placeholder's template geometry.
         pages: Optional page restrictions
         fill: Image fill mode
         
     Returns:
-        Combined API responses
+        {"batch_response": <batchUpdate response>}. Text, image and transform requests now go out
+        in one batchUpdate, so this replaces the former separate "text_response"/"image_response" keys.
     """
     if ctx:
         await ctx.info(f"🔄 Starting batch operations on presentation {presentation_id}")
     
-    results = {}
-    
-    # 1. Replace text first
-    if text_mapping:
-        logger.info("Performing text replacements...")
-        results['text_response'] = await batch_text_replace(text_mapping, presentation_id, pages, ctx)
-    
-    # 2. Replace images 
-    if image_mapping:
-        logger.info("Performing image replacements...")
-        results['image_response'] = await batch_image_replace(
-            image_mapping, presentation_id, pages, fill, transform_configs, ctx
-        )
+    if pages is None:
+        pages = []
+
+    # Transform, text and image requests go out in a single batchUpdate; Slides applies them in order,
+    # so the placeholder shapes are moved before being replaced with images
+    image_mapping = image_mapping or {}
+    text_requests = _build_text_requests(text_mapping or {}, pages)
+    image_requests = _build_image_requests(image_mapping, pages, fill)
+    if not text_requests and not image_requests:
+        logger.warning("No replacements to perform")
+        return {}
+
+    service = get_slides_service()
+    transform_requests = await _transform_requests_for(service, presentation_id, transform_configs, image_mapping)
+    requests = transform_requests + text_requests + image_requests
+
+    logger.info(
+        f"Performing {len(text_requests)} text, {len(image_requests)} image "
+        f"and {len(transform_requests)} transform requests in one batch..."
+    )
+    results = {
+        "batch_response": await _execute(service.presentations().batchUpdate(
+            presentationId=presentation_id,
+            body={"requests": requests}
+        ))
+    }
     
     if ctx:
         await ctx.info("✅ Batch operations completed successfully")
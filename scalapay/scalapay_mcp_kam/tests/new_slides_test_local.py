@@ -4,25 +4,30 @@ import logging
 import os
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
 
 import GoogleApiSupport.drive as Drive
 import GoogleApiSupport.slides as Slides
-import pandas as pd
 from dotenv import load_dotenv
 from fastmcp import Context
 from googleapiclient.discovery import build
-from langchain_openai import ChatOpenAI
-from mcp_use import MCPAgent, MCPClient
 from scalapay.scalapay_mcp_kam.prompts.charts_prompt import MONTHLY_SALES_PROMPT as MONTHLY_SALES_CHART_PROMPT
 from scalapay.scalapay_mcp_kam.tools.plot_chart import plot_monthly_sales_chart
 
+# langchain / mcp_use are heavy to import; load them only when slides are actually generated
+if TYPE_CHECKING:
+    from mcp_use import MCPAgent, MCPClient
+
 # Set up logging
 logging.basicConfig(level=logging.DEBUG, format="[%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
 
 # Set credentials
 os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "./scalapay/scalapay_mcp_kam/credentials.json"
+
+# Load .env once at import rather than on every create_slides call
+load_dotenv()
+
 drive_service = build("drive", "v3")
 
 
@@ -51,6 +56,8 @@ class ReActIteration:
 
 class ReActSlidesGenerator:
     def __init__(self, max_iterations: int = 5, confidence_threshold: float = 0.8):
+        from langchain_openai import ChatOpenAI
+
         self.max_iterations = max_iterations
         self.confidence_threshold = confidence_threshold
         self.judge_llm = ChatOpenAI(model="gpt-4o", temperature=0.2)
@@ -108,7 +115,7 @@ class ReActSlidesGenerator:
                 suggestions=["Retry with original approach"],
             )
 
-    async def execute_mcp_query(self, query: str, merchant_token: str, client: MCPClient, agent: MCPAgent) -> str:
+    async def execute_mcp_query(self, query: str, merchant_token: str, client: "MCPClient", agent: "MCPAgent") -> str:
         """Execute MCP query and return result"""
         try:
             result = await agent.run(query.format(merchant_token=merchant_token), max_steps=30)
@@ -137,7 +144,8 @@ async def create_slides_with_react(
     if ctx:
         await ctx.info("🤖 Starting ReAct slide generation with LLM judge")
 
-    load_dotenv()
+    from langchain_openai import ChatOpenAI
+    from mcp_use import MCPAgent, MCPClient
 
     react_generator = ReActSlidesGenerator(max_iterations=5, confidence_threshold=0.8)
 
@@ -211,19 +219,25 @@ async def finalize_slides(
     iteration: int,
     ctx: Context | None = None,
 ) -> dict:
+    # plot_monthly_sales_chart converts the JSON string year keys itself while flattening
     raw_data = slides_content.structured_data.get("months", {})
-    normalized_data = {
-        month: {int(year): val for year, val in yearly_data.items()} for month, yearly_data in raw_data.items()
-    }
 
     chart_path = f"/tmp/monthly_sales_profit_chart_iteration_{iteration}.png"
-    chart_path, width_px, height_px = plot_monthly_sales_chart(normalized_data, output_path=chart_path)
 
     # Google Slides integration (no text replace anymore)
     presentation_id = "1hDkICKx4D3jHdxky_3_1iJcPFVQFxTkvlH7mVSFCx_o"
     folder_id = "1x03ugPUeGSsLYY2kH-FsNC9_f_M6iLGL"
-    output_file_id = Drive.copy_file(presentation_id, f"final_presentation_iter_{iteration}")
-    Drive.move_file(output_file_id, folder_id)
+
+    def copy_template() -> str:
+        file_id = Drive.copy_file(presentation_id, f"final_presentation_iter_{iteration}")
+        Drive.move_file(file_id, folder_id)
+        return file_id
+
+    # Render the chart in a worker thread while the template is duplicated on Drive
+    (chart_path, width_px, height_px), output_file_id = await asyncio.gather(
+        asyncio.to_thread(plot_monthly_sales_chart, raw_data, chart_path),
+        asyncio.to_thread(copy_template),
+    )
 
     upload_result = Drive.upload_file(
         file_name=f"monthly_sales_profit_chart_iter_{iteration}.png",
@@ -9,13 +9,20 @@ import re
 import sys
 import uuid
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from langchain_openai import ChatOpenAI
-from mcp_use import MCPAgent, MCPClient
+if TYPE_CHECKING:
+    from mcp_use import MCPAgent
 
 
 # ---------- small helpers ----------
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
+_ANY_FENCE_RE = re.compile(r"```\s*(.*?)\s*```", re.DOTALL)
+_UNESCAPED_SQUOTE_RE = re.compile(r"(?<!\\)'")
+_SLUG_INVALID_RE = re.compile(r"[^a-zA-Z0-9_-]+")
+_DASH_RUNS_RE = re.compile(r"-{2,}")
+
+
 def parse_json_from_text(text: str):
     """
     Robustly extract JSON from LLM text:
@@ -27,10 +34,10 @@ def parse_json_from_text(text: str):
         raise ValueError("Empty response")
 
     # 1) fenced ```json ... ```
-    m = re.search(r"```json\s*(.*?)\s*```", text, flags=re.DOTALL | re.IGNORECASE)
+    m = _JSON_FENCE_RE.search(text)
     if not m:
         # 2) any fenced block
-        m = re.search(r"```\s*(.*?)\s*```", text, flags=re.DOTALL)
+        m = _ANY_FENCE_RE.search(text)
     if m:
         candidate = m.group(1).strip()
         return json.loads(candidate)
@@ -44,15 +51,15 @@ def parse_json_from_text(text: str):
 
     # 4) last resort: replace single quotes and try whole string
     try:
-        s2 = re.sub(r"(?<!\\)'", '"', text)
+        s2 = _UNESCAPED_SQUOTE_RE.sub('"', text)
         return json.loads(s2)
     except Exception:
         raise ValueError("Could not find valid JSON in response")
 
 
 def _slug(s: str) -> str:
-    s = re.sub(r"[^a-zA-Z0-9_-]+", "-", s.strip().lower())
-    return re.sub(r"-+", "-", s).strip("-") or "item"
+    s = _SLUG_INVALID_RE.sub("-", s.strip().lower())
+    return _DASH_RUNS_RE.sub("-", s).strip("-") or "item"
 
 
 def _persist_plot(path: str | None, key: str, out_dir: str = "./plots") -> Optional[str]:
@@ -187,6 +194,10 @@ async def main():
     )
     args = parser.parse_args()
 
+    # Heavy client stacks are only needed when running the scenario, not when importing helpers
+    from langchain_openai import ChatOpenAI
+    from mcp_use import MCPAgent, MCPClient
+
     # Build a single client with BOTH servers
     client = MCPClient.from_dict(
         {
@@ -198,7 +209,7 @@ async def main():
     )
 
     llm = ChatOpenAI(model="gpt-4o")
-    agent = MCPAgent(llm=llm, client=client, max_steps=8, verbose=True)
+    agent = MCPAgent(llm=llm, client=client, max_steps=8, verbose=os.getenv("DEBUG_MODE", "false").lower() == "true")
     await agent.initialize()
 
     # 1) Test Alfred
@@ -6,6 +6,7 @@ import io
 import json
 import logging
 import os
+import re
 import string
 import time
 import unicodedata
@@ -23,6 +24,8 @@ LOG_FORMAT = "[%(levelname)s] %(message)s"
 logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
 logger = logging.getLogger("slides_test")
 
+_DASH_RUNS_RE = re.compile(r"-{2,}")
+
 
 # ---------------------------
 # Helpers: slug + pickers
@@ -52,8 +55,7 @@ def _slug(s: str, max_len: int = 40) -> str:
     s = "".join(ch if ch in valid else "-" for ch in s.replace(" ", "-"))
 
     # Clean up multiple consecutive hyphens
-    while "--" in s:
-        s = s.replace("--", "-")
+    s = _DASH_RUNS_RE.sub("-", s)
 
     # Remove leading/trailing hyphens
     s = s.strip("-")
@@ -151,7 +153,8 @@ def upload_png(drive, local_path: str, *, name: str, parent_folder_id: Optional[
     body = {"name": name if name.endswith(".png") else f"{name}.png", "mimeType": "image/png"}
     if parent_folder_id:
         body["parents"] = [resolve_shortcut(drive, parent_folder_id)]
-    media = MediaFileUpload(local_path, mimetype="image/png", resumable=True)
+    # Chart PNGs are small: a single multipart request avoids the resumable session round-trip
+    media = MediaFileUpload(local_path, mimetype="image/png")
     f = drive.files().create(body=body, media_body=media, fields="id", supportsAllDrives=True).execute()
     return f["id"]
 
@@ -706,6 +709,53 @@ def move_tokens_by_delta_abs(slides, presentation_id, tokens, dx_pt=0.0, dy_pt=0
         slides.presentations().batchUpdate(presentationId=presentation_id, body={"requests": reqs}).execute()
 
 
+def build_resize_requests(obj_ids: list[str], cfg: dict | None) -> list[dict]:
+    """
+    Build updatePageElementTransform requests applying a resize spec to each object.
+
+    See batch_replace_shapes_with_images_and_resize for the spec format.
+    """
+    if not cfg:
+        return []
+
+    mode = (cfg.get("mode") or "RELATIVE").upper()
+    unit = cfg.get("unit", "EMU")
+
+    sx  = cfg.get("scaleX")
+    sy  = cfg.get("scaleY")
+    tx  = cfg.get("translateX")
+    ty  = cfg.get("translateY")
+    shx = cfg.get("shearX")
+    shy = cfg.get("shearY")
+
+    if mode == "ABSOLUTE":
+        if (sx is not None and sx > 3.0) or (sy is not None and sy > 3.0):
+            logger.warning("ABSOLUTE scale >3.0 may push images off slide")
+
+    reqs = []
+    for obj_id in obj_ids or []:
+        transform_dict = {"unit": unit}
+        if sx  is not None: transform_dict["scaleX"]     = float(sx)
+        if sy  is not None: transform_dict["scaleY"]     = float(sy)
+        if tx  is not None: transform_dict["translateX"] = float(tx)
+        if ty  is not None: transform_dict["translateY"] = float(ty)
+        if shx is not None: transform_dict["shearX"]     = float(shx)
+        if shy is not None: transform_dict["shearY"]     = float(shy)
+
+        if len(transform_dict) == 1:
+            # only unit present -> skip
+            continue
+
+        reqs.append({
+            "updatePageElementTransform": {
+                "objectId": obj_id,
+                "applyMode": mode,
+                "transform": transform_dict
+            }
+        })
+    return reqs
+
+
 def batch_replace_shapes_with_images_and_resize(
     slides,
     presentation_id: str,
@@ -758,54 +808,13 @@ def batch_replace_shapes_with_images_and_resize(
         return
 
     # -------- Phase 2: per-token transforms
-    def _build_transform_requests(obj_ids: list[str], cfg: dict | None) -> list[dict]:
-        if not cfg:
-            return []
-
-        mode = (cfg.get("mode") or "RELATIVE").upper()
-        unit = cfg.get("unit", "EMU")
-
-        sx  = cfg.get("scaleX")
-        sy  = cfg.get("scaleY")
-        tx  = cfg.get("translateX")
-        ty  = cfg.get("translateY")
-        shx = cfg.get("shearX")
-        shy = cfg.get("shearY")
-
-        if mode == "ABSOLUTE":
-            if (sx is not None and sx > 3.0) or (sy is not None and sy > 3.0):
-                logging.warning("ABSOLUTE scale >3.0 may push images off slide")
-
-        reqs = []
-        for obj_id in obj_ids or []:
-            transform_dict = {"unit": unit}
-            if sx  is not None: transform_dict["scaleX"]     = float(sx)
-            if sy  is not None: transform_dict["scaleY"]     = float(sy)
-            if tx  is not None: transform_dict["translateX"] = float(tx)
-            if ty  is not None: transform_dict["translateY"] = float(ty)
-            if shx is not None: transform_dict["shearX"]     = float(shx)
-            if shy is not None: transform_dict["shearY"]     = float(shy)
-
-            if len(transform_dict) == 1:
-                # only unit present -> skip
-                continue
-
-            reqs.append({
-                "updatePageElementTransform": {
-                    "objectId": obj_id,
-                    "applyMode": mode,
-                    "transform": transform_dict
-                }
-            })
-        return reqs
-
     transform_reqs = []
     resize_map = resize_map or {}
 
     # For each token, select its override cfg if present, else fall back to global `resize`
     for token, ids in token_to_ids.items():
         cfg = resize_map.get(token, resize)
-        transform_reqs.extend(_build_transform_requests(ids, cfg))
+        transform_reqs.extend(build_resize_requests(ids, cfg))
 
     if transform_reqs:
         slides.presentations().batchUpdate(
@@ -19,11 +19,24 @@ data = {
 
 
 def plot_monthly_sales_chart(data: dict, output_path="/mnt/data/dynamic_chart_colored.png"):
-    import matplotlib.pyplot as plt
+    """
+    Plot grouped monthly bars per year.
+
+    ``data`` maps month -> {year: value}; year keys may be ints or numeric strings (as parsed from JSON).
+    """
     import numpy as np
+    from matplotlib.figure import Figure
 
     months = list(data.keys())
-    years = sorted(set(year for month in data.values() for year in month))
+    # Flatten once into (month index, year, value) cells, converting year keys as we go
+    cells = [(m, int(year), value) for m, yearly in enumerate(data.values()) for year, value in yearly.items()]
+    years = sorted({year for _, year, _ in cells})
+    year_index = {year: i for i, year in enumerate(years)}
+
+    # years x months grid of bar heights; missing months stay 0
+    grid = [[0] * len(months) for _ in years]
+    for m, year, value in cells:
+        grid[year_index[year]][m] = value
 
     # Dynamically assign distinct colors to years using a fixed color palette
     color_palette = [
@@ -48,10 +61,12 @@ def plot_monthly_sales_chart(data: dict, output_path="/mnt/data/dynamic_chart_co
     fig_height_inch = 4
     dpi = 150
 
-    fig, ax = plt.subplots(figsize=(fig_width_inch, fig_height_inch))
+    # Figure API (no pyplot global state), so charts can render in worker threads
+    fig = Figure(figsize=(fig_width_inch, fig_height_inch))
+    ax = fig.add_subplot()
 
     for i, year in enumerate(years):
-        values = [data[month].get(year, 0) for month in months]
+        values = grid[i]
         offsets = x + i * width
         bars = ax.bar(offsets, values, width, label=str(year), color=colors_by_year[year])
         for offset, value in zip(offsets, values):
@@ -62,11 +77,10 @@ def plot_monthly_sales_chart(data: dict, output_path="/mnt/data/dynamic_chart_co
     ax.set_xticklabels(months)
     ax.set_ylabel("Sales")
     ax.legend(title="Year")
-    ax.set_ylim(0, max(max(month.values()) for month in data.values()) + 10)
+    ax.set_ylim(0, max((value for _, _, value in cells), default=0) + 10)
 
     fig.tight_layout()
-    plt.savefig(output_path, dpi=dpi)
-    plt.close(fig)
+    fig.savefig(output_path, dpi=dpi)
 
     # Compute pixel dimensions
     width_px = int(fig_width_inch * dpi)
@@ -1,19 +1,21 @@
+import asyncio
+import functools
+import io
 import logging
 import os
 import time
+from typing import Dict
 
-import GoogleApiSupport.drive as Drive
-import GoogleApiSupport.slides as Slides
-import matplotlib.pyplot as plt
-import pandas as pd
 from dotenv import load_dotenv
 from fastmcp import Context
-from googleapiclient.discovery import build
-from langchain_openai import ChatOpenAI
-from mcp_use import MCPAgent, MCPClient
+from googleapiclient.http import MediaIoBaseDownload, MediaIoBaseUpload
+from matplotlib.figure import Figure
+
+from .config import get_config
 
 # Import our simple batch operations
 from .simple_batch_operations import batch_replace_with_positioning
+from .utils.google_connection_manager import connection_manager
 
 # Set up logging
 logging.basicConfig(level=logging.DEBUG, format="[%(levelname)s] %(message)s")
@@ -23,7 +25,97 @@ logger = logging.getLogger(__name__)
 # os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "/etc/secrets/credentials.json"
 os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "./scalapay/scalapay_mcp_kam/credentials.json"
 
-drive_service = build("drive", "v3")
+# Load .env once at import rather than on every create_slides call
+load_dotenv()
+
+
+# Static data for the monthly sales/profit chart
+STATIC_CHART_DATA = {
+    "Month": ["Jan", "Feb", "Mar", "Apr", "May", "Jun"],
+    "Sales": [4174, 4507, 1860, 2294, 2130, 3468],
+    "Profit": [1244, 321, 666, 1438, 530, 892],
+}
+
+# Chart PNG resolution; Slides displays images well below this, so higher values only cost encode time
+CHART_DPI = 150
+
+
+def _render_chart(data: Dict[str, list]) -> io.BytesIO:
+    """Render the monthly sales/profit line chart to an in-memory PNG"""
+    # Figure API (no pyplot global state), so concurrent renders don't interfere
+    fig = Figure(figsize=(8, 5))
+    ax = fig.add_subplot()
+    ax.plot(data["Month"], data["Sales"], marker="o", label="Sales")
+    ax.plot(data["Month"], data["Profit"], marker="o", label="Profit")
+    ax.set_title("Monthly Sales and Profit", fontsize=16)
+    ax.set_xlabel("Month", fontsize=12)
+    ax.set_ylabel("Amount", fontsize=12)
+    ax.legend()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=CHART_DPI)
+    buffer.seek(0)
+    return buffer
+
+
+@functools.lru_cache(maxsize=1)
+def _static_chart_png() -> bytes:
+    """Render the static chart once per process; every create_slides call uploads the same PNG"""
+    return _render_chart(STATIC_CHART_DATA).getvalue()
+
+
+# PDF export is streamed to disk in chunks of this size instead of being buffered whole
+PDF_DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def _export_pdf(file_id: str, pdf_path: str) -> None:
+    """Stream the presentation's PDF export to ``pdf_path`` (blocking; run it in a worker thread)"""
+    drive = connection_manager.get_drive_service_sync()
+    request = drive.files().export_media(fileId=file_id, mimeType="application/pdf")
+    request.http = connection_manager.thread_http()
+    with io.FileIO(pdf_path, "wb") as fh:
+        downloader = MediaIoBaseDownload(fh, request, chunksize=PDF_DOWNLOAD_CHUNK_SIZE)
+        done = False
+        while not done:
+            _, done = downloader.next_chunk(num_retries=get_config().google_api_num_retries)
+
+
+async def _copy_template(presentation_id: str, folder_id: str) -> str:
+    """Copy the slides template straight into the output folder, returning the copy's file ID"""
+    drive = connection_manager.get_drive_service_sync()
+    response = await connection_manager.execute(
+        drive.files().copy(
+            fileId=presentation_id,
+            body={"name": "final_presentation", "parents": [folder_id]},
+            fields="id",
+            supportsAllDrives=True,
+        )
+    )
+    return response["id"]
+
+
+async def _upload_chart(buffer: io.BytesIO, file_name: str, folder_id: str) -> dict:
+    """Upload an in-memory PNG into the output folder, returning the Drive response (with its ``id``)"""
+    drive = connection_manager.get_drive_service_sync()
+    return await connection_manager.execute(
+        drive.files().create(
+            body={"name": file_name, "mimeType": "image/png", "parents": [folder_id]},
+            media_body=MediaIoBaseUpload(buffer, mimetype="image/png"),
+            fields="id",
+            supportsAllDrives=True,
+        )
+    )
+
+
+async def _trash_quietly(file_id: str) -> None:
+    """Move an orphaned Drive file (template copy or chart upload) to the trash, logging failures"""
+    drive = connection_manager.get_drive_service_sync()
+    try:
+        await connection_manager.execute(
+            drive.files().update(fileId=file_id, body={"trashed": True}, fields="id", supportsAllDrives=True)
+        )
+        logger.info(f"Trashed orphaned file {file_id}")
+    except Exception:
+        logger.warning(f"Could not trash orphaned file {file_id}", exc_info=True)
 
 
 async def create_slides(merchant_token: str, starting_date: str, end_date: str, ctx: Context | None = None) -> dict:
@@ -32,7 +124,6 @@ async def create_slides(merchant_token: str, starting_date: str, end_date: str,
     if ctx:
         await ctx.info("🚀 Starting slide generation")
 
-    load_dotenv()
     """
     config = {
         "mcpServers": {
@@ -58,27 +149,14 @@ async def create_slides(merchant_token: str, starting_date: str, end_date: str,
     )
     print(f"\nResult: {alfred_result}")
     """
-    # Static data
-    data = {
-        "Month": ["Jan", "Feb", "Mar", "Apr", "May", "Jun"],
-        "Sales": [4174, 4507, 1860, 2294, 2130, 3468],
-        "Profit": [1244, 321, 666, 1438, 530, 892],
-    }
-    df = pd.DataFrame(data)
-    logger.debug("DataFrame created successfully")
+    presentation_id = "1hDkICKx4D3jHdxky_3_1iJcPFVQFxTkvlH7mVSFCx_o"
+    folder_id = "1x03ugPUeGSsLYY2kH-FsNC9_f_M6iLGL"
 
-    chart_path = "/tmp/monthly_sales_profit_chart.png"
+    # Duplicating the template doesn't depend on the chart, so start it while the chart renders
+    copy_task = asyncio.create_task(_copy_template(presentation_id, folder_id))
     try:
-        plt.figure(figsize=(8, 5))
-        plt.plot(df["Month"], df["Sales"], marker="o", label="Sales")
-        plt.plot(df["Month"], df["Profit"], marker="o", label="Profit")
-        plt.title("Monthly Sales and Profit", fontsize=16)
-        plt.xlabel("Month", fontsize=12)
-        plt.ylabel("Amount", fontsize=12)
-        plt.legend()
-        plt.savefig(chart_path, dpi=300)
-        plt.close()
-        logger.info(f"Chart saved to: {chart_path}")
+        chart_buffer = io.BytesIO(await asyncio.to_thread(_static_chart_png))
+        logger.info(f"Chart rendered: {chart_buffer.getbuffer().nbytes} bytes")
         if ctx:
             await ctx.info("📈 Chart image generated")
 
@@ -86,37 +164,39 @@ async def create_slides(merchant_token: str, starting_date: str, end_date: str,
         logger.exception("Chart creation failed")
         if ctx:
             await ctx.error("❌ Chart creation failed")
+        # The copy runs in a worker thread and can't be cancelled; let it finish and trash the result
+        (copied,) = await asyncio.gather(copy_task, return_exceptions=True)
+        if not isinstance(copied, BaseException):
+            await _trash_quietly(copied)
         return {"error": "Chart creation failed"}
 
-    presentation_id = "1hDkICKx4D3jHdxky_3_1iJcPFVQFxTkvlH7mVSFCx_o"
-    folder_id = "1x03ugPUeGSsLYY2kH-FsNC9_f_M6iLGL"
-    try:
-        output_file_id = Drive.copy_file(presentation_id, "final_presentation")
-        Drive.move_file(output_file_id, folder_id)
-        logger.info(f"Slides copied and moved: {output_file_id}")
-        if ctx:
-            await ctx.info("📄 Template duplicated")
-    except Exception:
-        logger.exception("Slides preparation failed")
+    upload_task = asyncio.create_task(_upload_chart(chart_buffer, "monthly_sales_profit_chart.png", folder_id))
+    output_file_id, upload_result = await asyncio.gather(copy_task, upload_task, return_exceptions=True)
+
+    if isinstance(output_file_id, Exception):
+        logger.error("Slides preparation failed", exc_info=output_file_id)
         if ctx:
             await ctx.error("❌ Slide template preparation failed")
+        if not isinstance(upload_result, Exception) and upload_result.get("id"):
+            await _trash_quietly(upload_result["id"])
         return {"error": "Slides preparation failed"}
+    logger.info(f"Slides copied and moved: {output_file_id}")
+    if ctx:
+        await ctx.info("📄 Template duplicated")
 
-    try:
-        upload_result = Drive.upload_file(
-            file_name="monthly_sales_profit_chart.png", parent_folder_id=[folder_id], local_file_path=chart_path
-        )
-        chart_file_id = upload_result.get("file_id")
-        logger.info(f"Chart uploaded: {chart_file_id}")
-        if ctx:
-            await ctx.info("☁️ Chart uploaded to Drive")
-        if not chart_file_id:
-            return {"error": "Upload failed - no file ID"}
-    except Exception:
-        logger.exception("Upload failed")
+    if isinstance(upload_result, Exception):
+        logger.error("Upload failed", exc_info=upload_result)
         if ctx:
             await ctx.error("❌ Upload to Drive failed")
+        await _trash_quietly(output_file_id)
         return {"error": "Upload failed"}
+    chart_file_id = upload_result.get("id")
+    logger.info(f"Chart uploaded: {chart_file_id}")
+    if ctx:
+        await ctx.info("☁️ Chart uploaded to Drive")
+    if not chart_file_id:
+        await _trash_quietly(output_file_id)
+        return {"error": "Upload failed - no file ID"}
 
     direct_url = f"https://drive.google.com/uc?export=view&id={chart_file_id}"
 
@@ -164,9 +244,10 @@ async def create_slides(merchant_token: str, starting_date: str, end_date: str,
 
     pdf_path = None
     try:
-        info = Slides.get_presentation_info(output_file_id)
+        slides = connection_manager.get_service_sync()
+        info = await connection_manager.execute(slides.presentations().get(presentationId=output_file_id))
         pdf_path = f"/tmp/{output_file_id}.pdf"
-        Slides.download_presentation_as_pdf(drive_service, output_file_id, pdf_path)
+        await asyncio.to_thread(_export_pdf, output_file_id, pdf_path)
         logger.info("PDF exported")
         if ctx:
             await ctx.info("📥 Slides exported as PDF")
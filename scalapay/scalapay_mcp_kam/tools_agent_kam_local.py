@@ -1,7 +1,11 @@
 import asyncio
+import functools
+import hashlib
 import io
+import itertools
 import logging
 import os
+import re
 import string
 import time
 import unicodedata
@@ -10,17 +14,14 @@ from typing import Any, Dict, List, Optional
 
 import GoogleApiSupport.drive as Drive
 import GoogleApiSupport.slides as Slides
-import matplotlib.pyplot as plt
-import pandas as pd
 from dotenv import load_dotenv
 from fastmcp import Context
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
 from GoogleApiSupport.slides import Transform, execute_batch_update, get_all_shapes_placeholders
-from langchain_openai import ChatOpenAI
 from scalapay.scalapay_mcp_kam.agents.agent_alfred import mcp_tool_run
 from scalapay.scalapay_mcp_kam.agents.agent_matplot import mcp_matplot_run
+from scalapay.scalapay_mcp_kam.configs.resize_configs import PER_CHART_RESIZE, RESIZE_DEFAULT
 
 # Clean positioning system integration
 from scalapay.scalapay_mcp_kam.positioning import configure_positioning, get_positioning_status
@@ -32,16 +33,15 @@ from scalapay.scalapay_mcp_kam.prompts.charts_prompt import (
 )
 from scalapay.scalapay_mcp_kam.tests.test_fill_template_sections import (
     add_speaker_notes_to_slides,
-    batch_replace_shapes_with_images_and_resize,
-    batch_text_replace,
     build_text_and_image_maps,
     build_text_and_image_maps_enhanced,
     copy_file,
-    make_all_shapes_normal_weight,
     make_file_public,
     move_file,
     upload_png,
 )
+from scalapay.scalapay_mcp_kam.simple_batch_operations import build_transform_requests
+from scalapay.scalapay_mcp_kam.utils.google_connection_manager import connection_manager
 
 # Set up logging
 logging.basicConfig(level=logging.DEBUG, format="[%(levelname)s] %(message)s")
@@ -49,31 +49,55 @@ logger = logging.getLogger(__name__)
 
 # Set credentials
 os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = "/Users/keem.adorable@scalapay.com/scalapay/scalapay_mcp_kam/scalapay/scalapay_mcp_kam/credentials.json"
-drive_service = build("drive", "v3")
-slides_service = build("slides", "v1")
+# Shared services (credentials loaded once, bundled discovery docs) from the connection manager
+drive_service = connection_manager.get_drive_service_sync()
+slides_service = connection_manager.get_service_sync()
 
+# Load .env once at import rather than on every create_slides call
+load_dotenv()
 
-def _slug(s: str, max_len: int = 40) -> str:
-    s = "".join(c for c in unicodedata.normalize("NFKD", s) if ord(c) < 128)
-    s = s.lower().strip()
-    valid = f"{string.ascii_lowercase}{string.digits}-_"
-    s = "".join(ch if ch in valid else "-" for ch in s.replace(" ", "-"))
-    while "--" in s:
-        s = s.replace("--", "-")
+
+# ---------- helpers ----------
+# ASCII chars outside [a-z0-9_] (spaces included) map to "_" in one str.translate pass
+_UNDERSCORE_SLUG_TABLE = str.maketrans(
+    {c: "_" for c in map(chr, range(128)) if c not in f"{string.ascii_lowercase}{string.digits}_"}
+)
+_UNDERSCORE_RUNS_RE = re.compile(r"_{2,}")
+
+
+def _slug(s: str, max_len: int = 60) -> str:
+    # ASCII fold
+    s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
+    # replace spaces and invalid chars with underscore, then collapse repeats
+    s = s.lower().strip().translate(_UNDERSCORE_SLUG_TABLE)
+    s = _UNDERSCORE_RUNS_RE.sub("_", s).strip("_")
     return s[:max_len] or "section"
 
 
 # ---------- drive helpers (upload + permissions + url + folder handling) ----------
+# Files below this size go up in a single multipart request; resumable uploads cost an extra
+# session-initiation round-trip that only pays off for large files
+RESUMABLE_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+
+
+def _png_media(local_path: str) -> MediaFileUpload:
+    resumable = os.path.getsize(local_path) >= RESUMABLE_UPLOAD_THRESHOLD
+    return MediaFileUpload(local_path, mimetype="image/png", resumable=resumable)
+
+
+@functools.lru_cache(maxsize=128)
 def resolve_shortcut(file_id: str) -> str:
-    f = (
-        drive_service.files()
-        .get(
-            fileId=file_id,
-            fields="id,mimeType,shortcutDetails",
-            supportsAllDrives=True,
-        )
-        .execute()
+    """
+    Return the target ID if ``file_id`` is a Drive shortcut, else ``file_id`` (memoized per process)
+
+    Called from worker threads, so the request runs on the calling thread's own transport.
+    """
+    request = connection_manager.get_drive_service_sync().files().get(
+        fileId=file_id,
+        fields="id,mimeType,shortcutDetails",
+        supportsAllDrives=True,
     )
+    f = connection_manager.execute_sync(request)
     if f.get("mimeType") == "application/vnd.google-apps.shortcut":
         return f["shortcutDetails"]["targetId"]
     return file_id
@@ -81,12 +105,20 @@ def resolve_shortcut(file_id: str) -> str:
 
 def upload_chart_png(local_path: str, *, name: str, parent_folder_id: str) -> str:
     parent = resolve_shortcut(parent_folder_id) if parent_folder_id else None
-    media = MediaFileUpload(local_path, mimetype="image/png", resumable=True)
+    media = _png_media(local_path)
     body = {"name": name if name.endswith(".png") else f"{name}.png", "mimeType": "image/png"}
     if parent:
         body["parents"] = [parent]
-    f = drive_service.files().create(body=body, media_body=media, fields="id", supportsAllDrives=True).execute()
-    return f["id"]
+    request = connection_manager.get_drive_service_sync().files().create(
+        body=body, media_body=media, fields="id", supportsAllDrives=True
+    )
+    return connection_manager.execute_sync(request)["id"]
+
+
+def _file_digest(local_path: str) -> str:
+    """Content hash of a local file, used to upload identical chart PNGs only once"""
+    with open(local_path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
 
 
 def drive_direct_view_url(file_id: str) -> str:
@@ -117,14 +149,20 @@ def build_batch_replace_requests(sections: list, folder_id: str | None):
     """
     requests = []
     uploads = []
+    uploaded_by_digest: Dict[str, str] = {}
+    run_stamp = int(time.time())
 
-    for sec in sections:
+    for idx, sec in enumerate(sections):
         toks = tokens_for_title(sec["title"])
 
-        # Upload image
-        pretty_name = f"{toks['base']}_{int(time.time())}.png"
-        file_id = upload_chart_png(sec["chart_path"], name=pretty_name, parent_folder_id=folder_id)
-        make_file_public(file_id)
+        # Upload image (identical PNGs, e.g. fallback charts, reuse the first upload)
+        digest = _file_digest(sec["chart_path"])
+        file_id = uploaded_by_digest.get(digest)
+        if file_id is None:
+            pretty_name = f"{toks['base']}_{run_stamp}_{idx}.png"
+            file_id = upload_chart_png(sec["chart_path"], name=pretty_name, parent_folder_id=folder_id)
+            make_file_public(file_id)
+            uploaded_by_digest[digest] = file_id
         img_url = drive_direct_view_url(file_id)
         uploads.append({"title": sec["title"], "file_id": file_id, "image_url": img_url})
 
@@ -163,6 +201,10 @@ def build_batch_replace_requests(sections: list, folder_id: str | None):
 
 
 # ---------- slide export (pdf) ----------
+# Bounds the bytes held in memory per download request; Slides PDFs fit in one or two chunks
+PDF_DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+
 def export_presentation_pdf(presentation_id: str, out_path: str) -> str:
     """
     Export a Google Slides presentation as PDF.
@@ -180,30 +222,25 @@ def export_presentation_pdf(presentation_id: str, out_path: str) -> str:
     try:
         logger.info(f"Exporting presentation {presentation_id} to PDF: {out_path}")
 
-        # Check if presentation exists first
-        try:
-            drive_service.files().get(fileId=presentation_id, fields="id,name").execute()
-        except HttpError as e:
-            if e.resp.status == 404:
-                raise Exception(f"Presentation not found: {presentation_id}")
-            else:
-                raise Exception(f"Error accessing presentation {presentation_id}: {e}")
-
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
 
-        # Export the presentation as PDF
+        # Export the presentation as PDF; a missing presentation surfaces as a 404 on the export
+        # itself, so there is no separate existence check round-trip
         req = drive_service.files().export_media(fileId=presentation_id, mimeType="application/pdf")
-        fh = io.FileIO(out_path, "wb")
-        downloader = MediaIoBaseDownload(fh, req)
-        done = False
-
-        while not done:
-            status, done = downloader.next_chunk()
-            if status:
-                logger.debug(f"PDF export progress: {int(status.progress() * 100)}%")
-
-        fh.close()
+        try:
+            with io.FileIO(out_path, "wb") as fh:
+                downloader = MediaIoBaseDownload(fh, req, chunksize=PDF_DOWNLOAD_CHUNK_SIZE)
+                done = False
+
+                while not done:
+                    status, done = downloader.next_chunk()
+                    if status:
+                        logger.debug(f"PDF export progress: {int(status.progress() * 100)}%")
+        except HttpError as e:
+            if e.resp.status == 404:
+                raise Exception(f"Presentation not found: {presentation_id}")
+            raise Exception(f"Error accessing presentation {presentation_id}: {e}")
 
         # Verify the file was created and has content
         if not os.path.exists(out_path):
@@ -230,6 +267,10 @@ def export_presentation_pdf(presentation_id: str, out_path: str) -> str:
         raise
 
 
+# Disambiguates generated slide IDs created within the same second
+_slide_counter = itertools.count()
+
+
 def build_section_slide(
     presentation_id: str,
     *,
@@ -239,7 +280,7 @@ def build_section_slide(
     slide_index: int | None = 1,
     slide_id: str | None = None,
 ) -> str:
-    slide_id = slide_id or f"slide_{int(time.time())}"
+    slide_id = slide_id or f"slide_{int(time.time())}_{next(_slide_counter)}"
     title_id = f"title_{slide_id}"
     para_id = f"para_{slide_id}"
     img_id = f"img_{slide_id}"
@@ -340,30 +381,7 @@ def iter_sections(result_obj: dict) -> list[dict]:
     return sections
 
 
-import logging
-import string
-import time
-import unicodedata
-
-logger = logging.getLogger(__name__)
-
-
 # ---------- helpers ----------
-def _slug(s: str, max_len: int = 60) -> str:
-    # ASCII fold
-    s = "".join(c for c in unicodedata.normalize("NFKD", s) if ord(c) < 128)
-    s = s.lower().strip()
-    # replace spaces and invalid chars with underscore
-    valid = f"{string.ascii_lowercase}{string.digits}_"
-    s = s.replace(" ", "_")
-    s = "".join(ch if ch in valid else "_" for ch in s)
-    # collapse repeats
-    while "__" in s:
-        s = s.replace("__", "_")
-    s = s.strip("_")
-    return s[:max_len] or "section"
-
-
 def _pick_paragraph(section_dict: dict) -> str | None:
     return (
         section_dict.get("slides_struct", {}).get("paragraph")
@@ -377,6 +395,134 @@ def _pick_chart_path(section_dict: dict) -> str | None:
 
 
 # ---------- main filler ----------
+# Max concurrent chart uploads per fill; keeps bursts within Drive's per-user rate limits
+UPLOAD_CONCURRENCY = 8
+
+
+def _upload_png(local_path: str, name: str, parent_id: Optional[str]) -> str:
+    """
+    Upload a chart PNG and return its file ID.
+
+    Blocking; meant for worker threads. Requests run on the calling thread's own transport
+    since the shared service's httplib2 connection is not thread-safe.
+    """
+    body = {"name": name, "mimeType": "image/png"}
+    if parent_id:
+        body["parents"] = [parent_id]
+    media = _png_media(local_path)
+    request = connection_manager.get_drive_service_sync().files().create(
+        body=body, media_body=media, fields="id", supportsAllDrives=True
+    )
+    return connection_manager.execute_sync(request)["id"]
+
+
+def _make_files_public(file_ids: List[str]) -> None:
+    """Share the files with anyone with the link using a single batched Drive request (blocking)"""
+
+    def _on_response(file_id, response, exception):
+        if exception is not None:
+            logger.warning(f"make_file_public failed ({file_id}): {exception}")
+
+    drive = connection_manager.get_drive_service_sync()
+    batch = drive.new_batch_http_request(callback=_on_response)
+    for file_id in file_ids:
+        batch.add(
+            drive.permissions().create(
+                fileId=file_id, body={"type": "anyone", "role": "reader"}, fields="id", supportsAllDrives=True
+            ),
+            request_id=file_id,
+        )
+    batch.execute(http=connection_manager.thread_http())
+
+
+# Only the fields needed to match tokens to the shapes that contain them, plus their current transform
+_SHAPE_TEXT_FIELDS = "slides(pageElements(objectId,transform,shape(text(textElements(textRun(content))))))"
+
+
+def _shape_texts(presentation: dict) -> Dict[str, str]:
+    """Map each shape's objectId to its full text"""
+    texts = {}
+    for page in presentation.get("slides", []):
+        for pe in page.get("pageElements", []):
+            text_elements = pe.get("shape", {}).get("text", {}).get("textElements", [])
+            text = "".join(el.get("textRun", {}).get("content", "") for el in text_elements)
+            if text:
+                texts[pe["objectId"]] = text
+    return texts
+
+
+def _shape_transforms(presentation: dict) -> Dict[str, dict]:
+    """Map each page element's objectId to its current transform"""
+    return {
+        pe["objectId"]: pe.get("transform", {})
+        for page in presentation.get("slides", [])
+        for pe in page.get("pageElements", [])
+    }
+
+
+def build_fill_requests(
+    shape_texts: Dict[str, str],
+    text_map: Dict[str, str],
+    image_map: Dict[str, str],
+    *,
+    replace_method: str = "CENTER_INSIDE",
+    resize: dict | None = None,
+    resize_map: dict[str, dict] | None = None,
+    shape_transforms: Dict[str, dict] | None = None,
+) -> List[dict]:
+    """
+    Build every request of a template fill, in the order Slides must apply them:
+      1. paragraph shapes set to normal weight (as make_all_shapes_normal_weight)
+      2. text token replacements
+      3. resize transforms on the image placeholder shapes, which the images then inherit
+      4. image token replacements
+
+    Resize specs (see configs.resize_configs) are merged into each placeholder's current
+    transform from ``shape_transforms``, so their scales are multipliers of the template size.
+    """
+    requests = [
+        {
+            "updateTextStyle": {
+                "objectId": shape_id,
+                "textRange": {"type": "ALL"},
+                "style": {"bold": False, "fontSize": {"magnitude": 22, "unit": "PT"}},
+                "fields": "bold,fontSize",
+            }
+        }
+        for shape_id, text in shape_texts.items()
+        if "_paragraph" in text
+    ]
+    requests.extend(
+        {"replaceAllText": {"containsText": {"text": token, "matchCase": False}, "replaceText": value}}
+        for token, value in text_map.items()
+    )
+    if resize or resize_map:
+        resize_map = resize_map or {}
+        shape_transforms = shape_transforms or {}
+        lowered = {shape_id: text.lower() for shape_id, text in shape_texts.items()}
+        transform_config, placeholder_shapes = {}, {}
+        for token in image_map:
+            config = resize_map.get(token, resize)
+            if not config:
+                continue
+            transform_config[token] = config
+            placeholder_shapes[token] = [
+                {"objectId": shape_id, "transform": shape_transforms.get(shape_id, {})}
+                for shape_id, text in lowered.items()
+                if token.lower() in text
+            ]
+        requests.extend(build_transform_requests(transform_config, placeholder_shapes))
+    requests.extend(
+        {
+            "replaceAllShapesWithImage": {
+                "containsText": {"text": token, "matchCase": False},
+                "imageUrl": url,
+                "replaceMethod": replace_method,
+            }
+        }
+        for token, url in image_map.items()
+    )
+    return requests
 
 
 async def fill_template_for_all_sections_new(
@@ -391,10 +537,12 @@ async def fill_template_for_all_sections_new(
 ):
 
     # 0) build maps with slug validation
-    logger.info("Input results structure: %s", str(results)[:1000] + "..." if len(str(results)) > 1000 else str(results))
+    if logger.isEnabledFor(logging.INFO):
+        results_repr = str(results)
+        logger.info("Input results structure: %s", results_repr[:1000] + "..." if len(results_repr) > 1000 else results_repr)
     text_map, sections = build_text_and_image_maps(results, template_id)
     logger.info("Renderable sections: %d", len(sections))
-    print("Text map is: ", text_map)
+    logger.debug("Text map: %s", text_map)
 
     # Debug slug mapping validation
     from scalapay.scalapay_mcp_kam.utils.slug_validation import debug_slug_mapping
@@ -418,43 +566,63 @@ async def fill_template_for_all_sections_new(
 
     slug_mapper = SlugMapper(template_id)
 
-    image_map = {}
-    uploads = []
-    for sec in sections:
+    # Uploads are independent network round-trips, so run them concurrently (bounded for Drive's quota)
+    parent_id = await asyncio.to_thread(resolve_shortcut, folder_id) if folder_id else None
+    semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+    run_stamp = int(time.time())
+
+    # Sections with byte-identical PNGs (e.g. fallback charts) share a single upload
+    uploads_by_digest: Dict[str, asyncio.Future] = {}
+
+    async def _upload_file(local_path: str, name: str) -> str:
+        async with semaphore:
+            return await asyncio.to_thread(_upload_png, local_path, name, parent_id)
+
+    async def _upload_one(idx: int, sec: dict) -> dict:
         slug = slug_mapper.get_slug(sec["title"])
-        pretty_name = f"{slug}_{int(time.time())}.png"
-        file_id = upload_png(drive, sec["chart_path"], name=pretty_name, parent_folder_id=folder_id)
+        digest = await asyncio.to_thread(_file_digest, sec["chart_path"])
+        upload = uploads_by_digest.get(digest)
+        if upload is None:
+            pretty_name = f"{slug}_{run_stamp}_{idx}.png"
+            upload = uploads_by_digest[digest] = asyncio.ensure_future(_upload_file(sec["chart_path"], pretty_name))
+        file_id = await upload
+        url = f"https://drive.google.com/uc?export=view&id={file_id}"
+        return {"title": sec["title"], "file_id": file_id, "image_url": url, "slug": slug}
+
+    uploads = list(await asyncio.gather(*(_upload_one(idx, sec) for idx, sec in enumerate(sections))))
+    # Media uploads can't be batched, but all the permission grants can go out as one request
+    if uploads:
         try:
-            make_file_public(drive, file_id)
+            file_ids = list(dict.fromkeys(upload["file_id"] for upload in uploads))
+            await asyncio.to_thread(_make_files_public, file_ids)
         except Exception as e:
-            logger.warning(f"make_file_public failed ({file_id}): {e}")
-
-        url = f"https://drive.google.com/uc?export=view&id={file_id}"
-        image_map["{{" + f"{slug}_chart" + "}}"] = url
-        uploads.append({"title": sec["title"], "file_id": file_id, "image_url": url, "slug": slug})
+            logger.warning(f"make_file_public batch failed: {e}")
+    image_map = {"{{" + f"{upload['slug']}_chart" + "}}": upload["image_url"] for upload in uploads}
 
-    print("image map is: ", image_map)
+    logger.debug("Image map: %s", image_map)
     logger.info("Uploaded %d chart images", len(uploads))
     logger.debug("First 5 uploads: %s", uploads[:5])
 
-    # 3) replace text
-    logger.info("Replacing %d text tokens…", len(text_map))
+    # 3) + 4) paragraph styling, text, resizing and images in a single batchUpdate
+    logger.info("Replacing %d text tokens and %d image tokens…", len(text_map), len(image_map))
     logger.debug("Some text tokens: %s", list(text_map.items())[:5])
-    # Make all text shapes in presentation normal weight
-    make_all_shapes_normal_weight(presentation_id)
-    batch_text_replace(slides, presentation_id, text_map)
-
-    # 4) replace images
-    logger.info("Replacing %d image tokens…", len(image_map))
     logger.debug("Some image tokens: %s", list(image_map.items())[:5])
-    batch_replace_shapes_with_images_and_resize(
-        slides,
-        presentation_id,
+    presentation = await connection_manager.execute(
+        slides.presentations().get(presentationId=presentation_id, fields=_SHAPE_TEXT_FIELDS)
+    )
+    requests = build_fill_requests(
+        _shape_texts(presentation),
+        text_map,
         image_map,
         replace_method="CENTER_INSIDE",  # or CENTER_CROP, etc.
-        resize=resize,           # global fallback
-        resize_map=resize_map,     # per-token overrides
+        resize=resize,  # global fallback
+        resize_map=resize_map,  # per-token overrides
+        shape_transforms=_shape_transforms(presentation),
     )
+    if requests:
+        await connection_manager.execute(
+            slides.presentations().batchUpdate(presentationId=presentation_id, body={"requests": requests})
+        )
 
 
     return {
@@ -535,20 +703,24 @@ async def fill_template_for_all_sections_new_enhanced(
 
     logger.info("Uploaded %d chart images", len(uploads))
 
-    # Phase 4: Enhanced text replacement (slide-optimized content)
-    logger.info("Replacing %d optimized text tokens…", len(text_map))
-    make_all_shapes_normal_weight(presentation_id)
-    batch_text_replace(slides, presentation_id, text_map)
-
-    # Phase 5: Image replacement (existing logic)
-    logger.info("Replacing %d image tokens…", len(image_map))
-    batch_replace_shapes_with_images_and_resize(
-        slides,
-        presentation_id,
+    # Phase 4 + 5: paragraph styling, optimized text and images in a single batchUpdate
+    logger.info("Replacing %d optimized text tokens and %d image tokens…", len(text_map), len(image_map))
+    presentation = await connection_manager.execute(
+        slides.presentations().get(presentationId=presentation_id, fields=_SHAPE_TEXT_FIELDS)
+    )
+    requests = build_fill_requests(
+        _shape_texts(presentation),
+        text_map,
         image_map,
-        resize={"mode": "ABSOLUTE", "scaleX": 400, "scaleY": 400, "unit": "PT", "translateX": 130, "translateY": 250},
         replace_method="CENTER_INSIDE",
+        resize=RESIZE_DEFAULT,
+        resize_map=PER_CHART_RESIZE,
+        shape_transforms=_shape_transforms(presentation),
     )
+    if requests:
+        await connection_manager.execute(
+            slides.presentations().batchUpdate(presentationId=presentation_id, body={"requests": requests})
+        )
 
     # Phase 6: NEW - Speaker notes integration
     notes_result = {"notes_added": 0}
@@ -588,8 +760,6 @@ async def create_slides(merchant_token: str, starting_date: str, end_date: str,
     if ctx:
         await ctx.info("🚀 Starting slide generation")
 
-    load_dotenv()
-
     # Run the query with configurable concurrent processing
     results = await mcp_tool_run(
         requests_list=[
@@ -611,7 +781,7 @@ async def create_slides(merchant_token: str, starting_date: str, end_date: str,
         end_date=end_date,
         chart_prompt_template=GENERAL_CHART_PROMPT
     )
-    print(f"\n[DEBUG] Raw Results: {results}")
+    logger.debug("Raw results: %s", results)
 
     # Configure debug folder for chart output (if specified)
 
@@ -644,15 +814,14 @@ async def create_slides(merchant_token: str, starting_date: str, end_date: str,
         logger.error(f"Chart generation failed: {e}")
         charts_list = results  # fallback to original results
 
-    print(f"\n[DEBUG] Charts List is: {charts_list}")
-    logger.debug(f"[DEBUG] Charts list is: {charts_list}")
+    logger.debug("Charts list: %s", charts_list)
     
     # Debug chart paths
     for key, value in charts_list.items():
         if isinstance(value, dict):
             chart_path = value.get("chart_path")
             errors = value.get("errors", [])
-            print(f"[DEBUG] {key}: chart_path={chart_path}, errors={errors}")
+            logger.debug("%s: chart_path=%s, errors=%s", key, chart_path, errors)
             if ctx:
                 if chart_path:
                     await ctx.info(f"✅ {key}: Chart saved to {chart_path}")
@@ -715,7 +884,6 @@ async def create_slides(merchant_token: str, starting_date: str, end_date: str,
             await ctx.info("🎯 Using next-generation positioning system")
 
         # Use clean positioning system with template processing
-        from scalapay.scalapay_mcp_kam.configs.resize_configs import RESIZE_DEFAULT, PER_CHART_RESIZE
         final = await fill_template_for_all_sections_new(
             drive_service,
             slides_service,
@@ -732,23 +900,24 @@ async def create_slides(merchant_token: str, starting_date: str, end_date: str,
             await ctx.error("❌ Slide template preparation failed")
         return {"error": "Slides preparation failed"}
 
-    # 3) Export PDF
+    # 3) Export PDF and fetch presentation info; both only need the final presentation, so overlap them
     pdf_path = f"/tmp/{pres_id}.pdf"
-    try:
-        export_presentation_pdf(pres_id, pdf_path)
-        if ctx:
-            await ctx.info("📥 Slides exported as PDF")
-    except Exception:
-        logger.exception("PDF export failed")
+    pdf_result, info = await asyncio.gather(
+        asyncio.to_thread(export_presentation_pdf, pres_id, pdf_path),
+        asyncio.to_thread(Slides.get_presentation_info, pres_id),
+        return_exceptions=True,
+    )
+    if isinstance(pdf_result, Exception):
+        logger.error("PDF export failed", exc_info=pdf_result)
         if ctx:
             await ctx.warning("⚠️ PDF export failed")
         pdf_path = None
+    elif ctx:
+        await ctx.info("📥 Slides exported as PDF")
 
     # Append presentation info to output
-    try:
-        info = Slides.get_presentation_info(pres_id)
-    except Exception:
-        logger.exception("Failed to retrieve presentation info")
+    if isinstance(info, Exception):
+        logger.error("Failed to retrieve presentation info", exc_info=info)
         info = {}
 
     # 4) Return a tidy summary with enhanced information
@@ -6,14 +6,18 @@ Implements singleton pattern for proper connection reuse and resource management
 import asyncio
 import logging
 import os
+import threading
 import time
 from threading import Lock
 from typing import Any, Dict, Optional
 
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.http import build_http
 
+from ..config import get_config
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,16 +40,18 @@ class GoogleSlidesConnectionManager:
             return
 
         self._service = None
+        self._drive_service = None
+        self._credentials = None
+        self._thread_local = threading.local()
         self._service_lock = asyncio.Lock()
         self._connection_count = 0
         self._max_connections = 3
         self._initialized = True
         logger.info("GoogleSlidesConnectionManager initialized")
 
-    def _create_service_with_connection_pooling(self):
-        """Create Google Slides service with proper HTTP connection pooling and authentication."""
-        try:
-            # Load service account credentials explicitly
+    def _get_credentials(self):
+        """Load the service account credentials once and share them across Slides and Drive."""
+        if self._credentials is None:
             credentials_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
             if not credentials_path:
                 credentials_path = "./scalapay/scalapay_mcp_kam/credentials.json"
@@ -54,14 +60,21 @@ class GoogleSlidesConnectionManager:
                 raise Exception(f"Credentials file not found: {credentials_path}")
 
             # Load credentials from service account file
-            credentials = service_account.Credentials.from_service_account_file(
+            self._credentials = service_account.Credentials.from_service_account_file(
                 credentials_path,
                 scopes=["https://www.googleapis.com/auth/presentations", "https://www.googleapis.com/auth/drive"],
             )
             logger.info(f"Loaded service account credentials from {credentials_path}")
+        return self._credentials
 
+    def _create_service_with_connection_pooling(self):
+        """Create Google Slides service with proper HTTP connection pooling and authentication."""
+        try:
             # Build service with explicit credentials (Google API client handles HTTP internally)
-            service = build("slides", "v1", credentials=credentials, cache_discovery=False)
+            # static_discovery uses the discovery document bundled with googleapiclient (no network fetch)
+            service = build(
+                "slides", "v1", credentials=self._get_credentials(), cache_discovery=False, static_discovery=True
+            )
             logger.info("Google Slides service created with connection pooling and explicit authentication")
             return service
 
@@ -82,17 +95,56 @@ class GoogleSlidesConnectionManager:
             self._service = self._create_service_with_connection_pooling()
         return self._service
 
+    def get_drive_service_sync(self):
+        """Get a Google Drive service sharing the Slides credentials."""
+        if self._drive_service is None:
+            self._drive_service = build(
+                "drive", "v3", credentials=self._get_credentials(), cache_discovery=False, static_discovery=True
+            )
+            logger.info("Google Drive service created with shared credentials")
+        return self._drive_service
+
+    def thread_http(self) -> AuthorizedHttp:
+        """
+        Get the authorized HTTP transport for the calling thread.
+
+        httplib2 connections are not thread-safe, so each worker thread keeps its own keep-alive
+        transport instead of sharing the one bound to the service objects. Pass it to
+        ``request.execute(http=...)`` when executing requests off the event loop.
+        """
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = AuthorizedHttp(self._get_credentials(), http=build_http())
+            self._thread_local.http = http
+        return http
+
+    def execute_sync(self, request):
+        """
+        Execute a googleapiclient request on the calling thread's transport.
+
+        Requests failing with 429/5xx are retried by googleapiclient with randomized exponential backoff.
+        """
+        return request.execute(http=self.thread_http(), num_retries=get_config().google_api_num_retries)
+
+    async def execute(self, request):
+        """Execute a googleapiclient request in a worker thread so it doesn't block the event loop."""
+        return await asyncio.to_thread(self.execute_sync, request)
+
     async def reset_connection(self):
         """Reset connection pool if issues are detected."""
         async with self._service_lock:
             logger.warning("Resetting Google Slides service connection")
-            self._service = None
-            self._connection_count = 0
+            self._reset()
 
     def reset_connection_sync(self):
         """Synchronous version of reset_connection for use in non-async contexts."""
         logger.warning("Resetting Google Slides service connection (sync)")
+        self._reset()
+
+    def _reset(self):
         self._service = None
+        self._drive_service = None
+        self._thread_local = threading.local()
         self._connection_count = 0
 
 
@@ -4,34 +4,36 @@ Quick fix for slug mapping based on actual template analysis.
 This creates a direct mapping without requiring Google API access.
 """
 
+import functools
 import logging
-from typing import Dict, Set
+from types import MappingProxyType
+from typing import FrozenSet, Mapping
+
+from scalapay.scalapay_mcp_kam.utils.slug_validation import _slug_enhanced
 
 logger = logging.getLogger(__name__)
 
 
-def get_template_slug_mappings() -> Dict[str, str]:
-    """
-    Return direct mappings based on actual template analysis from debug output.
-
-    From the debug output, the actual template contains these tokens:
-    - {{monthly-sales-over-time_title}}
-    - {{monthly_sales_chart}}
-    - {{monthly_sales_yoy_chart}}
-    - {{monthly-orders-by-user-type_title}}
-    - {{monthly_orders_by_user_type_chart}}
-    - {{monthly-orders-by-user-type_paragraph}}
-    - {{orders-by-product-type-i-e-pay-in-3-pay_title}}
-    - {{orders_by_product_type_i_e_pay_in_3_pay_in_4_chart}}
-    - {{scalapay-users-demographic-in-percentage_title}}
-    - {{scalapay_users_demographic_in_percentages_chart}}
-    - {{aov_title}}
-    - {{average_item_chart}}
-    - {{aov-by-product-type-i-e-pay-in-3-pay-in_title}}
-    - {{aov_by_product_type_i_e_pay_in_3_pay_in_4_chart}}
-    - {{aov-by-product-type-i-e-pay-in-3-pay-in_paragraph}}
-    """
-    return {
+# Direct mappings based on actual template analysis from debug output.
+#
+# From the debug output, the actual template contains these tokens:
+# - {{monthly-sales-over-time_title}}
+# - {{monthly_sales_chart}}
+# - {{monthly_sales_yoy_chart}}
+# - {{monthly-orders-by-user-type_title}}
+# - {{monthly_orders_by_user_type_chart}}
+# - {{monthly-orders-by-user-type_paragraph}}
+# - {{orders-by-product-type-i-e-pay-in-3-pay_title}}
+# - {{orders_by_product_type_i_e_pay_in_3_pay_in_4_chart}}
+# - {{scalapay-users-demographic-in-percentage_title}}
+# - {{scalapay_users_demographic_in_percentages_chart}}
+# - {{aov_title}}
+# - {{average_item_chart}}
+# - {{aov-by-product-type-i-e-pay-in-3-pay-in_title}}
+# - {{aov_by_product_type_i_e_pay_in_3_pay_in_4_chart}}
+# - {{aov-by-product-type-i-e-pay-in-3-pay-in_paragraph}}
+_SLUG_MAPPINGS: Mapping[str, str] = MappingProxyType(
+    {
         "monthly sales over time": "monthly-sales-over-time",
         "monthly sales year over year": "monthly_sales_yoy",
         "monthly sales by product type over time": "monthly-sales-by-product-type-over-time",
@@ -41,11 +43,11 @@ def get_template_slug_mappings() -> Dict[str, str]:
         "AOV": "aov",
         "AOV by product type (i.e. pay in 3, pay in 4)": "aov-by-product-type-i-e-pay-in-3-pay-in",
     }
+)
 
-
-def get_template_slugs() -> Set[str]:
-    """Extract unique slugs from the known template tokens."""
-    template_slugs = {
+# Unique slugs from the known template tokens
+_TEMPLATE_SLUGS: FrozenSet[str] = frozenset(
+    {
         "monthly-sales-over-time",
         "monthly_sales",
         "monthly_sales_yoy",
@@ -60,43 +62,59 @@ def get_template_slugs() -> Set[str]:
         "aov-by-product-type-i-e-pay-in-3-pay-in",
         "aov_by_product_type_i_e_pay_in_3_pay_in_4",
     }
-    return template_slugs
+)
+
+
+def get_template_slug_mappings() -> Mapping[str, str]:
+    """Return the (read-only) direct mappings from data keys to template slugs."""
+    return _SLUG_MAPPINGS
+
+
+def get_template_slugs() -> FrozenSet[str]:
+    """Return the unique slugs from the known template tokens."""
+    return _TEMPLATE_SLUGS
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_slug(data_key: str) -> str:
+    """Resolve a data key against the known template slugs (memoized: the tables are constant)."""
+    # First check direct mappings
+    if data_key in _SLUG_MAPPINGS:
+        mapped_slug = _SLUG_MAPPINGS[data_key]
+        if mapped_slug in _TEMPLATE_SLUGS:
+            logger.debug(f"Direct mapping: '{data_key}' -> '{mapped_slug}'")
+            return mapped_slug
+
+    # Fallback to enhanced slug generation
+    generated_slug = _slug_enhanced(data_key, _TEMPLATE_SLUGS)
+
+    if generated_slug in _TEMPLATE_SLUGS:
+        logger.debug(f"Generated slug validated: '{data_key}' -> '{generated_slug}'")
+        return generated_slug
+
+    # Final fallback - use direct mapping even if not validated
+    if data_key in _SLUG_MAPPINGS:
+        mapped_slug = _SLUG_MAPPINGS[data_key]
+        logger.warning(f"Using unvalidated mapping: '{data_key}' -> '{mapped_slug}'")
+        return mapped_slug
+
+    logger.warning(f"No mapping found for '{data_key}', using generated: '{generated_slug}'")
+    return generated_slug
 
 
 class OptimizedSlugMapper:
     """Optimized slug mapper that uses known template patterns."""
 
+    __slots__ = ("slug_mappings", "template_slugs")
+
     def __init__(self):
-        self.slug_mappings = get_template_slug_mappings()
-        self.template_slugs = get_template_slugs()
+        self.slug_mappings = _SLUG_MAPPINGS
+        self.template_slugs = _TEMPLATE_SLUGS
         logger.info(f"OptimizedSlugMapper initialized with {len(self.template_slugs)} template slugs")
 
     def get_slug(self, data_key: str) -> str:
         """Get the correct slug for a data key."""
-        # First check direct mappings
-        if data_key in self.slug_mappings:
-            mapped_slug = self.slug_mappings[data_key]
-            if mapped_slug in self.template_slugs:
-                logger.debug(f"Direct mapping: '{data_key}' -> '{mapped_slug}'")
-                return mapped_slug
-
-        # Fallback to enhanced slug generation
-        from scalapay.scalapay_mcp_kam.utils.slug_validation import _slug_enhanced
-
-        generated_slug = _slug_enhanced(data_key, self.template_slugs)
-
-        if generated_slug in self.template_slugs:
-            logger.debug(f"Generated slug validated: '{data_key}' -> '{generated_slug}'")
-            return generated_slug
-
-        # Final fallback - use direct mapping even if not validated
-        if data_key in self.slug_mappings:
-            mapped_slug = self.slug_mappings[data_key]
-            logger.warning(f"Using unvalidated mapping: '{data_key}' -> '{mapped_slug}'")
-            return mapped_slug
-
-        logger.warning(f"No mapping found for '{data_key}', using generated: '{generated_slug}'")
-        return generated_slug
+        return _resolve_slug(data_key)
 
 
 def update_slug_validation_files():
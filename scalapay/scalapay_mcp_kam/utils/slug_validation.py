@@ -14,6 +14,8 @@ from googleapiclient.discovery import build
 
 logger = logging.getLogger(__name__)
 
+_DASH_RUNS_RE = re.compile(r"-{2,}")
+
 
 def get_template_placeholders(template_id: str) -> List[str]:
     """Extract all placeholder tokens from Google Slides template."""
@@ -125,8 +127,7 @@ def _slug_enhanced(s: str, template_slugs: Set[str] = None, max_len: int = 60) -
     s = "".join(ch if ch in valid else "-" for ch in s)
 
     # Collapse multiple hyphens
-    while "--" in s:
-        s = s.replace("--", "-")
+    s = _DASH_RUNS_RE.sub("-", s)
     s = s.strip("-")
 
     # Apply length limit but try to keep meaningful parts
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test suite for the rigid Alfred prompt builder.
+Tests prompt assembly, caching of data-type invariant sections and error handling.
+"""
+
+import asyncio
+
+import pytest
+from scalapay.scalapay_mcp_kam.data_schemas.alfred_schema_registry import ALFRED_DATA_REQUIREMENTS
+from scalapay.scalapay_mcp_kam.prompts import alfred_rigid_prompts
+from scalapay.scalapay_mcp_kam.prompts.alfred_rigid_prompts import (
+    RIGID_PROMPT_TEMPLATES,
+    AlfredPromptBuilder,
+    alfred_prompt_builder,
+    get_alfred_prompt_builder,
+)
+
+
+class TestPromptAssembly:
+    """Test that prompts contain the request-specific values."""
+
+    def test_prompt_contains_request_values(self):
+        """Test that merchant, dates and data type are rendered into the prompt."""
+        prompt = alfred_prompt_builder.build_prompt("AOV", "merchant_abc", "2024-01-01", "2024-06-30")
+
+        assert "DATA REQUEST: AOV" in prompt
+        assert "MERCHANT: merchant_abc" in prompt
+        assert "DATE RANGE: 2024-01-01 to 2024-06-30" in prompt
+        assert "CHART TYPE: line" in prompt
+
+    def test_additional_context_is_appended(self):
+        """Test that additional context is only rendered when provided."""
+        with_context = alfred_prompt_builder.build_prompt("AOV", "m", "a", "b", additional_context="extra")
+        without_context = alfred_prompt_builder.build_prompt("AOV", "m", "a", "b")
+
+        assert with_context.endswith("ADDITIONAL CONTEXT: extra")
+        assert "ADDITIONAL CONTEXT" not in without_context
+
+    def test_all_registered_data_types_build(self):
+        """Test that every registered data type produces a prompt."""
+        for data_type in ALFRED_DATA_REQUIREMENTS:
+            assert alfred_prompt_builder.build_prompt(data_type, "m", "a", "b")
+
+    def test_unsupported_data_type_raises(self):
+        """Test that unknown data types are rejected."""
+        with pytest.raises(ValueError, match="Unsupported data type"):
+            alfred_prompt_builder.build_prompt("not a data type", "m", "a", "b")
+
+    def test_async_build_matches_sync_build(self):
+        """Test that the async variant produces the same prompt."""
+        prompt = asyncio.run(alfred_prompt_builder.abuild_prompt("AOV", "m", "a", "b", "ctx"))
+
+        assert prompt == alfred_prompt_builder.build_prompt("AOV", "m", "a", "b", "ctx")
+
+
+class TestPromptParts:
+    """Test the cacheable prefix / volatile suffix split."""
+
+    def test_prefix_is_merchant_invariant(self):
+        """Test that only the suffix changes between merchants and dates."""
+        prefix_1, suffix_1 = alfred_prompt_builder.build_prompt_parts("AOV", "merchant_1", "2024-01-01", "2024-06-30")
+        prefix_2, suffix_2 = alfred_prompt_builder.build_prompt_parts("AOV", "merchant_2", "2023-01-01", "2023-06-30")
+
+        assert prefix_1 == prefix_2
+        assert "merchant_1" not in prefix_1
+        assert "merchant_1" in suffix_1
+        assert suffix_1 != suffix_2
+
+    def test_build_prompt_joins_parts(self):
+        """Test that build_prompt is the prefix followed by the suffix."""
+        parts = alfred_prompt_builder.build_prompt_parts("AOV", "m", "a", "b", "ctx")
+
+        assert alfred_prompt_builder.build_prompt("AOV", "m", "a", "b", "ctx") == "\n".join(parts)
+
+
+class TestPromptCaching:
+    """Test that data-type invariant sections are reused across merchants."""
+
+    def test_static_body_is_cached_across_merchants(self):
+        """Test that building for several merchants renders the static body once."""
+        builder = AlfredPromptBuilder()
+        builder.clear_cache()
+
+        first = builder.build_prompt("AOV", "merchant_1", "a", "b")
+        second = builder.build_prompt("AOV", "merchant_2", "a", "b")
+
+        info = alfred_rigid_prompts._static_body.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+        assert first.replace("merchant_1", "merchant_2") == second
+
+    def test_clear_cache(self):
+        """Test that clear_cache drops cached bodies."""
+        builder = AlfredPromptBuilder()
+        builder.build_prompt("AOV", "m", "a", "b")
+        builder.clear_cache()
+
+        assert alfred_rigid_prompts._static_body.cache_info().currsize == 0
+
+
+class TestTokenCount:
+    """Test prompt token counting."""
+
+    def test_falls_back_to_length_estimate(self, monkeypatch):
+        """Test that counting still works when the tokenizer can't be loaded."""
+        monkeypatch.setattr(alfred_rigid_prompts, "_encoding", lambda: None)
+
+        assert alfred_prompt_builder.count_tokens("x" * 40) == 10
+
+
+class TestPromptBatch:
+    """Test building prompts for several merchants at once."""
+
+    def test_batch_matches_individual_prompts(self):
+        """Test that batch prompts are identical to per-merchant prompts."""
+        merchants = ["merchant_1", "merchant_2", "merchant_3"]
+        batch = alfred_prompt_builder.build_prompts_batch("AOV", merchants, "a", "b", "ctx")
+
+        assert batch == [alfred_prompt_builder.build_prompt("AOV", m, "a", "b", "ctx") for m in merchants]
+
+    def test_batch_unsupported_data_type_raises(self):
+        """Test that unknown data types are rejected before any prompt is built."""
+        with pytest.raises(ValueError, match="Unsupported data type"):
+            alfred_prompt_builder.build_prompts_batch("not a data type", ["m"], "a", "b")
+
+
+class TestSharedBuilder:
+    """Test the shared prompt builder instance."""
+
+    def test_factory_returns_shared_instance(self):
+        """Test that the factory and the module-level alias are the same object."""
+        assert get_alfred_prompt_builder() is get_alfred_prompt_builder()
+        assert get_alfred_prompt_builder() is alfred_prompt_builder
+
+    def test_builder_rejects_attribute_assignment(self):
+        """Test that the shared builder cannot be mutated in place."""
+        with pytest.raises(AttributeError):
+            alfred_prompt_builder.cache = {}
+
+
+class TestTemplateSanity:
+    """Test that generated prompts and templates stay well-formed."""
+
+    def test_prompts_are_ascii(self):
+        """Test that prompts, fallback prompts and rigid templates contain no multi-byte glyphs."""
+        for data_type in ALFRED_DATA_REQUIREMENTS:
+            assert alfred_prompt_builder.build_prompt(data_type, "m", "a", "b").isascii()
+            assert alfred_prompt_builder.get_fallback_prompt(data_type, "{}", ["error"]).isascii()
+
+        for template in RIGID_PROMPT_TEMPLATES.values():
+            assert template.isascii()
+
+    def test_template_drift_is_rejected(self, monkeypatch):
+        """Test that leftover format escapes or placeholders in templates are caught."""
+        monkeypatch.setattr(alfred_rigid_prompts, "RIGID_PROMPT_TEMPLATES", {"broken": '{{"structured_data": {x}}}'})
+
+        with pytest.raises(ValueError, match="unrendered placeholder"):
+            alfred_rigid_prompts._validate_templates()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test suite for the prompt response cache.
+Tests hits and misses, TTL expiry, the in-memory bound, persistence and corrupt cache files.
+"""
+
+import asyncio
+import json
+import os
+
+from scalapay.scalapay_mcp_kam.prompts.cache import PromptResponseCache
+
+
+def _run(cache, prompt, response, **kwargs):
+    calls = []
+
+    async def runner(p):
+        calls.append(p)
+        return response
+
+    result = asyncio.run(cache.get_or_run(prompt, runner, **kwargs))
+    return result, calls
+
+
+class TestHitsAndMisses:
+    """Test basic lookups and hit/miss accounting."""
+
+    def test_miss_then_hit(self):
+        """Test that a stored response is returned and counted as a hit."""
+        cache = PromptResponseCache()
+        assert cache.get("p") is None
+        cache.set("p", {"a": 1})
+
+        assert cache.get("p") == {"a": 1}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_get_or_run_runs_once(self):
+        """Test that the runner is only awaited on the first call."""
+        cache = PromptResponseCache()
+        _, first_calls = _run(cache, "p", "result")
+        result, second_calls = _run(cache, "p", "other")
+
+        assert result == "result"
+        assert first_calls == ["p"]
+        assert second_calls == []
+
+    def test_unusable_responses_are_not_cached(self):
+        """Test that empty or rejected responses are retried on the next call."""
+        cache = PromptResponseCache()
+        _run(cache, "empty", "")
+        _run(cache, "rejected", "error", is_cacheable=lambda r: r != "error")
+
+        assert cache.get("empty") is None
+        assert cache.get("rejected") is None
+
+
+class TestExpiryAndBounds:
+    """Test TTL expiry and the in-memory size bound."""
+
+    def test_expired_entry_is_dropped(self):
+        """Test that an expired entry is a miss and no longer held in memory."""
+        cache = PromptResponseCache(ttl_seconds=60)
+        cache._entries[cache.make_key("p")] = (0.0, "value")
+
+        assert cache.get("p") is None
+        assert cache.make_key("p") not in cache._entries
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache keeps at most max_entries, evicting the least recently used."""
+        cache = PromptResponseCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+
+class TestPersistence:
+    """Test the on-disk cache directory."""
+
+    def test_entries_survive_a_new_instance(self, tmp_path):
+        """Test that persisted entries are loaded by a fresh cache."""
+        PromptResponseCache(str(tmp_path)).set("p", {"a": 1})
+
+        assert PromptResponseCache(str(tmp_path)).get("p") == {"a": 1}
+
+    def test_corrupt_or_foreign_files_are_misses(self, tmp_path):
+        """Test that invalid JSON or JSON of the wrong shape counts as a miss."""
+        cache = PromptResponseCache(str(tmp_path))
+        for prompt, content in (("bad", "{not json"), ("list", "[]"), ("keys", '{"response": 1}')):
+            with open(os.path.join(str(tmp_path), f"{cache.make_key(prompt)}.json"), "w") as f:
+                f.write(content)
+
+            assert cache.get(prompt) is None
+
+    def test_unserializable_response_leaves_no_file(self, tmp_path):
+        """Test that a response that can't be serialized is kept in memory only."""
+        cache = PromptResponseCache(str(tmp_path))
+        cache.set("p", {"value": object()})
+
+        assert os.listdir(str(tmp_path)) == []
+        assert cache.get("p") is not None
+
+    def test_persisted_file_is_complete_json(self, tmp_path):
+        """Test that the persisted entry holds the timestamp and response."""
+        cache = PromptResponseCache(str(tmp_path))
+        cache.set("p", "value")
+
+        with open(os.path.join(str(tmp_path), f"{cache.make_key('p')}.json")) as f:
+            data = json.load(f)
+        assert data["response"] == "value"
+        assert isinstance(data["created_at"], float)
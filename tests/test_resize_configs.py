@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Test suite for the chart placeholder resize specs.
+"""
+
+import pytest
+
+from scalapay.scalapay_mcp_kam.configs.resize_configs import PER_CHART_RESIZE, RESIZE_DEFAULT
+from scalapay.scalapay_mcp_kam.simple_batch_operations import build_transform_requests
+
+# A typical placeholder: 3000000 EMU intrinsic box scaled down, placed at (20pt, 30pt)
+TEMPLATE_TRANSFORM = {"scaleX": 0.5, "scaleY": 0.4, "translateX": 254000, "translateY": 381000, "unit": "EMU"}
+
+SPECS = {"default": RESIZE_DEFAULT, **PER_CHART_RESIZE}
+
+
+@pytest.mark.parametrize("name", sorted(SPECS))
+def test_spec_keeps_placeholder_near_template_size(name):
+    """Test that each spec emits a matrix close to the template size, at its configured position."""
+    spec = SPECS[name]
+    requests = build_transform_requests(
+        {"{{chart}}": spec}, {"{{chart}}": [{"objectId": "shape_1", "transform": TEMPLATE_TRANSFORM}]}
+    )
+
+    assert len(requests) == 1
+    update = requests[0]["updatePageElementTransform"]
+    transform = update["transform"]
+    assert update["objectId"] == "shape_1"
+    assert update["applyMode"] == "ABSOLUTE"
+    assert 0.5 <= transform["scaleX"] / TEMPLATE_TRANSFORM["scaleX"] <= 2
+    assert 0.5 <= transform["scaleY"] / TEMPLATE_TRANSFORM["scaleY"] <= 2
+    assert transform["scaleX"] == pytest.approx(TEMPLATE_TRANSFORM["scaleX"] * spec["scaleX"])
+    assert transform["translateX"] == spec["translateX"] * 12700
+    assert transform["translateY"] == spec["translateY"] * 12700
+    assert transform["unit"] == "EMU"
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test suite for the combined placeholder transform / replace batch.
+"""
+
+import asyncio
+
+from scalapay.scalapay_mcp_kam import simple_batch_operations as ops
+
+PRESENTATION = {
+    "slides": [
+        {
+            "pageElements": [
+                {
+                    "objectId": "shape_chart",
+                    "transform": {"scaleX": 2.0, "scaleY": 3.0, "translateX": 50800, "translateY": 76200, "unit": "EMU"},
+                    "shape": {"text": {"textElements": [{"textRun": {"content": "{{chart}}\n"}}]}},
+                },
+                {
+                    "objectId": "shape_title",
+                    "shape": {"text": {"textElements": [{"textRun": {"content": "{{title}}\n"}}]}},
+                },
+            ]
+        }
+    ]
+}
+
+
+class _FakeService:
+    """Slides service stub whose calls return (method, kwargs) tuples."""
+
+    def presentations(self):
+        return self
+
+    def get(self, **kwargs):
+        return ("get", kwargs)
+
+    def batchUpdate(self, **kwargs):
+        return ("batchUpdate", kwargs)
+
+
+def _run_batch(monkeypatch, transform_configs):
+    sent = []
+
+    async def fake_execute(request):
+        method, kwargs = request
+        if method == "get":
+            return PRESENTATION
+        sent.append(kwargs["body"]["requests"])
+        return {"replies": []}
+
+    monkeypatch.setattr(ops, "get_slides_service", _FakeService)
+    monkeypatch.setattr(ops, "_execute", fake_execute)
+    result = asyncio.run(
+        ops.batch_replace_with_positioning(
+            {"title": "Q1"}, {"chart": "https://example.com/c.png"}, "pres", transform_configs
+        )
+    )
+    assert result == {"batch_response": {"replies": []}}
+    assert len(sent) == 1
+    return sent[0]
+
+
+class TestBatchReplaceWithPositioning:
+    """Test request order and transform values of the single batchUpdate."""
+
+    def test_transforms_run_before_replacements(self, monkeypatch):
+        """Test that the placeholder is transformed before text and image replacement."""
+        requests = _run_batch(monkeypatch, {"chart": {"translateX": 130, "translateY": 250, "unit": "PT"}})
+
+        assert [next(iter(r)) for r in requests] == [
+            "updatePageElementTransform",
+            "replaceAllText",
+            "replaceAllShapesWithImage",
+        ]
+        assert requests[0]["updatePageElementTransform"]["objectId"] == "shape_chart"
+
+    def test_absolute_config_keeps_template_size(self, monkeypatch):
+        """Test that ABSOLUTE configs scale the template size and only move what they set."""
+        requests = _run_batch(monkeypatch, {"chart": {"scaleX": 1.5, "translateX": 130, "unit": "PT"}})
+
+        update = requests[0]["updatePageElementTransform"]
+        assert update["applyMode"] == "ABSOLUTE"
+        assert update["transform"] == {
+            "scaleX": 3.0,
+            "scaleY": 3.0,
+            "shearX": 0,
+            "shearY": 0,
+            "translateX": 130 * 12700,
+            "translateY": 76200,
+            "unit": "EMU",
+        }
+
+    def test_relative_config_is_passed_through(self, monkeypatch):
+        """Test that RELATIVE configs are sent as given, defaulting to the identity."""
+        requests = _run_batch(monkeypatch, {"chart": {"mode": "RELATIVE", "translateX": 10}})
+
+        update = requests[0]["updatePageElementTransform"]
+        assert update["applyMode"] == "RELATIVE"
+        assert update["transform"] == {
+            "scaleX": 1.0,
+            "scaleY": 1.0,
+            "shearX": 0,
+            "shearY": 0,
+            "translateX": 10,
+            "translateY": 0,
+            "unit": "PT",
+        }
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Test suite for paragraph windowing before slide optimization.
+"""
+
+from scalapay.scalapay_mcp_kam.agents.agent_alfred import _window_paragraph
+
+
+class TestWindowParagraph:
+    """Test that long paragraphs are capped without losing their opening."""
+
+    def test_short_paragraph_is_unchanged(self):
+        """Test that a paragraph within the limit is returned as-is."""
+        assert _window_paragraph("Sales grew. Orders too.", 100) == "Sales grew. Orders too."
+
+    def test_leading_sentences_are_kept(self):
+        """Test that whole leading sentences are kept up to the limit."""
+        paragraph = "Sales grew 10%. Orders rose. AOV fell slightly in March."
+
+        assert _window_paragraph(paragraph, 28) == "Sales grew 10%. Orders rose."
+
+    def test_oversized_first_sentence_is_cut_at_a_word_boundary(self):
+        """Test that a single sentence longer than the limit is not cut mid-word."""
+        paragraph = "Monthly sales increased steadily across every region this year."
+
+        windowed = _window_paragraph(paragraph, 20)
+        assert windowed == "Monthly sales"
+        assert paragraph.startswith(windowed)